@@ -17,6 +17,8 @@ from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.widgets import Static, Button, DataTable
 from textual.screen import ModalScreen
 
+from registry_client import call_response_text
+
 
 class ApiDetailModal(ModalScreen):
     """Modal screen for displaying full API call details with navigation"""
@@ -90,6 +92,7 @@ class ApiDetailModal(ModalScreen):
     
     def __init__(self, api_calls_data: list, current_index: int = 0, **kwargs):
         super().__init__(**kwargs)
+        # Shared with the debug console, not copied; a reload there rebinds its list instead of mutating this one
         self.api_calls_data = api_calls_data
         self.current_index = current_index
     
@@ -184,18 +187,20 @@ class ApiDetailModal(ModalScreen):
         ]
         
         # Show full response content if available, otherwise fall back to preview
-        full_content = call.get('response_content_full')
+        full_content = call_response_text(call)
         if full_content:
             # Escape opening markup bracket
             escaped_content = str(full_content).replace('[', '\\[')
+            # Large bodies are truncated when logged
+            truncated_note = f" (first {len(full_content)} chars)" if call.get('response_truncated') else ""
             if method == 'LOCAL':
                 content_lines.extend([
-                    "Command Output:",
+                    f"Command Output{truncated_note}:",
                     f"{escaped_content}"
                 ])
             else:
                 content_lines.extend([
-                    "Response Body:",
+                    f"Response Body{truncated_note}:",
                     f"{escaped_content}"
                 ])
         else:
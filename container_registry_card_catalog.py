@@ -17,6 +17,7 @@ import argparse
 import asyncio
 import logging
 import sys
+import time
 from typing import List, Optional
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
@@ -26,7 +27,7 @@ from textual.events import MouseDown
 from textual.message import Message
 
 from mock_data import mock_registry
-from registry_client import registry_manager
+from registry_client import RegistryClient, registry_manager
 from local_container_client import LocalContainerClient
 from info_modal import InfoModal
 from config_manager import config_manager
@@ -832,8 +833,8 @@ class RepositoryScreen(Screen):
         # Handle local container runtimes
         if registry_url.startswith("local://"):
             runtime = registry_url.split("://")[1]
-            client = LocalContainerClient(runtime)
-            result = await client.get_repositories()
+            async with LocalContainerClient(runtime) as client:
+                result = await client.get_repositories()
             
             if 'error' in result:
                 self.notify(f"❌ Error loading {runtime} repositories: {result['error']}", severity="error")
@@ -1301,6 +1302,10 @@ class ContainerCardCatalog(App):
         self.last_clicked_row = -1
         self.sort_reversed = False
         self.registry_config = {}  # In-memory registry config storage: {registry_url: {username, password, auth_type, monitored_repos, etc}}
+        self._registry_table = None  # Registry DataTable, resolved once in on_mount
+        # Partition registries by type once; status checks only visit local and remote ones
+        self._local_registries = [url for url in registries if url.startswith("local://")]
+        self._remote_registries = [url for url in registries if not url.startswith(("mock://", "local://"))]
         
         # Load saved configuration on startup
         self._load_saved_configuration()
@@ -1356,6 +1361,7 @@ class ContainerCardCatalog(App):
     
     def on_mount(self) -> None:
         """Initialize the application"""
+        self._registry_table = self.query_one("#registry_list", DataTable)
         self.load_registries()
         # Show initial details and set parent reference
         details_panel = self.query_one("#registry_details", RegistryDetailsPanel)
@@ -1365,6 +1371,10 @@ class ContainerCardCatalog(App):
         if not self.mock_mode and self.registries:
             self.run_worker(self.check_real_registries(), exclusive=True)
     
+    async def on_unmount(self) -> None:
+        """Close pooled registry connections on shutdown"""
+        await registry_manager.aclose()
+    
     def on_screen_resume(self) -> None:
         """Called when returning to this screen - sync details panel with cursor"""
         debug_logger.debug("Registry screen resume called")
@@ -1379,7 +1389,7 @@ class ContainerCardCatalog(App):
     def _sync_details_with_cursor(self) -> None:
         """Helper method to sync details panel with current cursor position"""
         try:
-            registry_table = self.query_one("#registry_list", DataTable)
+            registry_table = self._registry_table
             if hasattr(registry_table, 'cursor_coordinate') and registry_table.cursor_coordinate:
                 current_row = registry_table.cursor_coordinate[0]
                 debug_logger.debug("Syncing registry details panel with cursor",
@@ -1401,7 +1411,7 @@ class ContainerCardCatalog(App):
         
     def load_registries(self) -> None:
         """Load and populate registry data"""
-        registry_table = self.query_one("#registry_list", DataTable)
+        registry_table = self._registry_table
         
         # Use provided registries or sample data
         if self.registries:
@@ -1653,7 +1663,7 @@ class ContainerCardCatalog(App):
         """Handle key presses"""
         if event.key == "enter":
             # Get currently selected registry and navigate to repository view
-            registry_table = self.query_one("#registry_list", DataTable)
+            registry_table = self._registry_table
             if hasattr(registry_table, 'cursor_coordinate') and registry_table.cursor_coordinate:
                 row_index = registry_table.cursor_coordinate[0]
                 if row_index < len(self.registry_data):
@@ -1693,97 +1703,116 @@ class ContainerCardCatalog(App):
         else:
             # In mock mode, just reload the data
             debug_logger.debug("Reloading mock registry data")
-            registry_table = self.query_one("#registry_list", DataTable)
+            registry_table = self._registry_table
             registry_table.clear()
             self.registry_data = []
             self.load_registries()
     
+    async def _fetch_local_status(self, runtime: str, current_time: str) -> dict:
+        """Check a local container runtime and build its registry status info"""
+        async with LocalContainerClient(runtime) as client:
+            health_info = await client.check_health()
+            
+            if health_info['status'] != 'healthy':
+                return {
+                    "status": "❌",
+                    "api_version": f"{runtime} (Error)",
+                    "repo_count": "Error",
+                    "response_time": "N/A",
+                    "connection_status": f"Error: {health_info.get('error', 'Unknown')}",
+                    "last_checked": current_time
+                }
+            
+            version = health_info.get('version', 'Unknown')
+            
+            # Get actual repository count
+            try:
+                repos_result = await client.get_repositories()
+                repo_count = repos_result.get('total_repositories', 0) if 'error' not in repos_result else "Error"
+            except Exception as e:
+                debug_logger.debug("Local repository count failed",
+                                  runtime=runtime,
+                                  error=str(e))
+                repo_count = "Unknown"
+            
+            return {
+                "status": "🏠" if runtime == "podman" else "🐳",
+                "api_version": f"{runtime} {version}",
+                "repo_count": str(repo_count),
+                "response_time": f"{health_info.get('response_time', 0)}ms",
+                "connection_status": "Local",
+                "last_checked": current_time
+            }
+    
     async def check_real_registries(self) -> None:
         """Background task to check real registry status"""
-        registry_table = self.query_one("#registry_list", DataTable)
-        
-        for registry_url in self.registries:
-            if not registry_url.startswith("mock://"):
-                # Find the correct row index in the sorted registry_data
-                registry_row_index = None
-                for idx, registry_data in enumerate(self.registry_data):
-                    if registry_data["url"] == registry_url:
-                        registry_row_index = idx
-                        break
-                
-                if registry_row_index is None:
-                    continue  # Skip if not found
-                # Check registry status
-                if registry_url.startswith("local://"):
-                    # Handle local container runtime health check
-                    runtime = registry_url.split("://")[1]
-                    client = LocalContainerClient(runtime)
-                    health_info = await client.check_health()
-                    
-                    import time
-                    current_time = time.strftime("%H:%M:%S")
-                    
-                    if health_info['status'] == 'healthy':
-                        version = health_info.get('version', 'Unknown')
-                        
-                        # Get actual repository count
-                        try:
-                            client = LocalContainerClient(runtime)
-                            repos_result = await client.get_repositories()
-                            if 'error' not in repos_result:
-                                repo_count = repos_result.get('total_repositories', 0)
-                            else:
-                                repo_count = "Error"
-                        except:
-                            repo_count = "Unknown"
-                        
-                        status_info = {
-                            "status": "🏠" if runtime == "podman" else "🐳",
-                            "api_version": f"{runtime} {version}",
-                            "repo_count": str(repo_count),
-                            "response_time": f"{health_info.get('response_time', 0)}ms",
-                            "connection_status": "Local",
-                            "last_checked": current_time
-                        }
-                    else:
-                        status_info = {
-                            "status": "❌",
-                            "api_version": f"{runtime} (Error)",
-                            "repo_count": "Error",
-                            "response_time": "N/A",
-                            "connection_status": f"Error: {health_info.get('error', 'Unknown')}",
-                            "last_checked": current_time
-                        }
-                else:
-                    # Get auth config for this registry
-                    registry_config = self.registry_config.get(registry_url)
-                    status_info = await registry_manager.check_registry_status(registry_url, registry_config)
-                
-                # Update the registry data
-                self.registry_data[registry_row_index].update({
-                    "status": status_info["status"],
-                    "api_version": status_info["api_version"],
-                    "repo_count": status_info["repo_count"],
-                    "response_time": status_info["response_time"],
-                    "connection_status": status_info["connection_status"],
-                    "last_checked": status_info.get("last_checked", "Unknown")
-                })
-                
-                # Update the table row
-                registry_table.update_cell_at(
-                    (registry_row_index, 0), status_info["status"]
-                )
-                registry_table.update_cell_at(
-                    (registry_row_index, 3), str(status_info["repo_count"])
-                )
-                registry_table.update_cell_at(
-                    (registry_row_index, 4), status_info["api_version"]
-                )
-                
-                # If this row is currently selected, update details
-                if hasattr(registry_table, 'cursor_coordinate') and registry_table.cursor_coordinate:
-                    if registry_table.cursor_coordinate[0] == registry_row_index:
-                        self.update_details_for_row(registry_row_index)
+        # Registries are independent of each other, so check them concurrently
+        registry_urls = self._local_registries + self._remote_registries
+        results = await asyncio.gather(
+            *(self._check_local_registry(url) for url in self._local_registries),
+            *(self._check_remote_registry(url) for url in self._remote_registries),
+            return_exceptions=True
+        )
+        
+        for registry_url, result in zip(registry_urls, results):
+            if isinstance(result, Exception):
+                debug_logger.error("Registry status check failed", 
+                                  registry_url=registry_url,
+                                  error=str(result))
+    
+    async def _check_local_registry(self, registry_url: str) -> None:
+        """Check a local runtime and update its registry row"""
+        runtime = registry_url.split("://")[1]
+        status_info = await self._fetch_local_status(runtime, time.strftime("%H:%M:%S"))
+        self._apply_registry_status(registry_url, status_info)
+    
+    async def _check_remote_registry(self, registry_url: str) -> None:
+        """Check a remote registry and update its registry row"""
+        # Get auth config for this registry
+        registry_config = self.registry_config.get(registry_url)
+        status_info = await registry_manager.check_registry_status(registry_url, registry_config)
+        self._apply_registry_status(registry_url, status_info)
+    
+    def _find_registry_row(self, registry_url: str) -> Optional[int]:
+        """Find the row index of a registry in the (sorted) registry data"""
+        for idx, registry_data in enumerate(self.registry_data):
+            if registry_data["url"] == registry_url:
+                return idx
+        return None
+    
+    def _apply_registry_status(self, registry_url: str, status_info: dict) -> Optional[int]:
+        """Store status info for a registry and refresh its table row
+        
+        The row is looked up after the status check completes so a re-sort while
+        the check was in flight cannot update the wrong row.
+        """
+        registry_row_index = self._find_registry_row(registry_url)
+        if registry_row_index is None:
+            return None  # Skip if not found
+        
+        registry_table = self._registry_table
+        
+        # Update the registry data
+        self.registry_data[registry_row_index].update({
+            "status": status_info["status"],
+            "api_version": status_info["api_version"],
+            "repo_count": status_info["repo_count"],
+            "response_time": status_info["response_time"],
+            "connection_status": status_info["connection_status"],
+            "last_checked": status_info.get("last_checked", "Unknown")
+        })
+        
+        # Update the table row
+        registry_table.update_cell_at((registry_row_index, 0), status_info["status"])
+        registry_table.update_cell_at((registry_row_index, 3), str(status_info["repo_count"]))
+        registry_table.update_cell_at((registry_row_index, 4), status_info["api_version"])
+        
+        # If this row is currently selected, update details
+        if hasattr(registry_table, 'cursor_coordinate') and registry_table.cursor_coordinate:
+            if registry_table.cursor_coordinate[0] == registry_row_index:
+                self.update_details_for_row(registry_row_index)
+        
+        return registry_row_index
     
     def action_debug_console(self) -> None:
         """Open debug console"""
@@ -1800,7 +1829,7 @@ class ContainerCardCatalog(App):
         self.registry_data.sort(key=lambda x: x["name"].lower(), reverse=self.sort_reversed)
         
         # Rebuild table with sorted data
-        registry_table = self.query_one("#registry_list", DataTable)
+        registry_table = self._registry_table
         registry_table.clear()
         
         for registry in self.registry_data:
@@ -1819,7 +1848,7 @@ class ContainerCardCatalog(App):
     
     def action_configure_registry(self) -> None:
         """Open configuration modal for selected registry"""
-        registry_table = self.query_one("#registry_list", DataTable)
+        registry_table = self._registry_table
         if hasattr(registry_table, 'cursor_coordinate') and registry_table.cursor_coordinate:
             row_index = registry_table.cursor_coordinate[0]
             if row_index < len(self.registry_data):
@@ -1916,7 +1945,7 @@ class ContainerCardCatalog(App):
                 break
         
         # Refresh the details panel if this registry is currently selected
-        registry_table = self.query_one("#registry_list", DataTable)
+        registry_table = self._registry_table
         if hasattr(registry_table, 'cursor_coordinate') and registry_table.cursor_coordinate:
             current_row = registry_table.cursor_coordinate[0]
             self.update_details_for_row(current_row)
@@ -1940,14 +1969,9 @@ class ContainerCardCatalog(App):
     async def _refresh_single_registry(self, registry_url: str) -> None:
         """Refresh status for a single registry"""
         debug_logger.debug("Starting single registry refresh", registry_url=registry_url)
-        registry_table = self.query_one("#registry_list", DataTable)
         
         # Find the registry in our data
-        registry_row_index = None
-        for idx, registry_data in enumerate(self.registry_data):
-            if registry_data["url"] == registry_url:
-                registry_row_index = idx
-                break
+        registry_row_index = self._find_registry_row(registry_url)
         
         if registry_row_index is None:
             debug_logger.error("Registry not found in data for refresh", 
@@ -1965,40 +1989,10 @@ class ContainerCardCatalog(App):
                           has_registry_config=bool(registry_config),
                           auth_type=registry_config.get('auth_type') if registry_config else 'none')
         
-        if registry_url.startswith("local://"):
+        if registry_url in self._local_registries:
             # Handle local container runtime
             runtime = registry_url.split("://")[1]
-            client = LocalContainerClient(runtime)
-            health_info = await client.check_health()
-            
-            import time
-            current_time = time.strftime("%H:%M:%S")
-            
-            if health_info['status'] == 'healthy':
-                version = health_info.get('version', 'Unknown')
-                try:
-                    repos_result = await client.get_repositories()
-                    repo_count = repos_result.get('total_repositories', 0) if 'error' not in repos_result else "Error"
-                except:
-                    repo_count = "Unknown"
-                
-                status_info = {
-                    "status": "🏠" if runtime == "podman" else "🐳",
-                    "api_version": f"{runtime} {version}",
-                    "repo_count": str(repo_count),
-                    "response_time": f"{health_info.get('response_time', 0)}ms",
-                    "ssl_status": "Local",
-                    "last_checked": current_time
-                }
-            else:
-                status_info = {
-                    "status": "❌",
-                    "api_version": f"{runtime} (Error)",
-                    "repo_count": "Error",
-                    "response_time": "N/A",
-                    "ssl_status": f"Error: {health_info.get('error', 'Unknown')}",
-                    "last_checked": current_time
-                }
+            status_info = await self._fetch_local_status(runtime, time.strftime("%H:%M:%S"))
         else:
             debug_logger.debug("Checking remote registry status", 
                                registry_url=registry_url,
@@ -2011,42 +2005,19 @@ class ContainerCardCatalog(App):
                           status=status_info["status"],
                           repo_count=status_info["repo_count"])
         
-        # Update the registry data
-        self.registry_data[registry_row_index].update({
-            "status": status_info["status"],
-            "api_version": status_info["api_version"],
-            "repo_count": status_info["repo_count"],
-            "response_time": status_info["response_time"],
-            "connection_status": status_info["connection_status"],
-            "last_checked": status_info.get("last_checked", "Unknown")
-        })
-        
-        # Update the table row
-        registry_table.update_cell_at((registry_row_index, 0), status_info["status"])
-        registry_table.update_cell_at((registry_row_index, 3), str(status_info["repo_count"]))
-        registry_table.update_cell_at((registry_row_index, 4), status_info["api_version"])
+        registry_row_index = self._apply_registry_status(registry_url, status_info)
         
         debug_logger.debug("Registry table updated", 
                           row_index=registry_row_index,
-                          status_updated=True)
-        
-        # If this row is currently selected, update details
-        if hasattr(registry_table, 'cursor_coordinate') and registry_table.cursor_coordinate:
-            if registry_table.cursor_coordinate[0] == registry_row_index:
-                debug_logger.debug("Updating details panel for refreshed registry")
-                self.update_details_for_row(registry_row_index)
+                          status_updated=registry_row_index is not None)
     
     def _refresh_mock_registry_count(self, registry_url: str) -> None:
         """Refresh repository count display for mock registry after config changes"""
         debug_logger.debug("Starting mock registry count refresh", registry_url=registry_url)
-        registry_table = self.query_one("#registry_list", DataTable)
+        registry_table = self._registry_table
         
         # Find the registry in our data
-        registry_row_index = None
-        for idx, registry_data in enumerate(self.registry_data):
-            if registry_data["url"] == registry_url:
-                registry_row_index = idx
-                break
+        registry_row_index = self._find_registry_row(registry_url)
         
         if registry_row_index is None:
             debug_logger.error("Registry not found in data for mock refresh", 
@@ -2155,6 +2126,12 @@ def parse_arguments() -> argparse.Namespace:
         help="Add local container runtime (can be specified multiple times)"
     )
     
+    parser.add_argument(
+        "--insecure",
+        action="store_true",
+        help="Skip TLS certificate verification for registries (self-signed or test registries)"
+    )
+    
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -2234,6 +2211,7 @@ def main():
     
     # Set the TUI debug logger on the registry manager for auth/cache logging
     registry_manager.set_tui_debug_logger(debug_logger)
+    RegistryClient.verify_tls = not args.insecure
     
     app = ContainerCardCatalog(registries=registries, mock_mode=mock_mode)
     app.run()
@@ -12,87 +12,149 @@ Vibe-Coder: Andrew Potozniak <potozniak@redhat.com>
 Session Date: 2025-08-15
 """
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import DataTable, Static, Header, Footer
 from textual.screen import Screen
-from textual.events import MouseDown
+from textual.events import Click, MouseDown
+from textual.message import Message
+from functools import lru_cache
+from itertools import islice
+from typing import Tuple
+from urllib.parse import urlparse
 
+from api_detail_modal import ApiDetailModal
+from mock_data import mock_debug
+from registry_client import call_response_text, format_call_size, registry_manager
 
-class ApiCallDetailsPanel(Static):
-    """Right panel showing detailed API call information"""
+
+@lru_cache(maxsize=256)
+def _split_base_endpoint(url: str) -> Tuple[str, str]:
+    """Split an HTTP call URL into (base URL, endpoint) for the call list
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.call_info = None
+    Cached because most logged calls share a handful of registry base URLs.
+    """
+    base_url = "Unknown"
+    endpoint = url
     
-    def update_call_info(self, call_info: dict):
-        """Update the displayed API call information"""
-        self.call_info = call_info
-        if call_info:
-            # Escape opening markup bracket
-            url = str(call_info.get('url', 'Unknown')).replace('[', '\\[')
-            method = str(call_info.get('method', 'UNKN'))
-            status_code = call_info.get('status_code', 0)
-            duration = str(call_info.get('duration_ms', 'Unknown'))
-            size_bytes = str(call_info.get('size_bytes', 'Unknown'))
-            timestamp = str(call_info.get('timestamp', 'Unknown'))
-            
-            # Different status handling for local vs HTTP
-            if method == 'LOCAL':
-                if status_code == 0:
-                    status_emoji = "✅"
-                    status_text = f"Exit Code: 0 (Success)"
-                else:
-                    status_emoji = "❌"
-                    status_text = f"Exit Code: {status_code} (Error)"
-            else:
-                status_emoji = "✅" if status_code == 200 else "❌"
-                status_text = f"HTTP Status: {status_code}"
-            
-            # Use preview content (first 500 chars) for debug view
-            if method == 'LOCAL':
-                # LOCAL commands use 'response_content' for first 500 chars
-                content_display = str(call_info.get('response_content', 'No content')).replace('[', '\\[')
+    if "/v2/" in url:
+        parts = url.split("/v2/", 1)
+        base_url = parts[0]  # Everything before /v2/
+        endpoint_part = parts[1] if len(parts) > 1 else ""
+        endpoint = "/v2/" + endpoint_part
+    else:
+        # If no /v2/, try to extract base URL anyway
+        if "://" in url:
+            try:
+                parsed = urlparse(url)
+            except ValueError:
+                # urlparse only raises for malformed IPv6 hosts
+                base_url = url
             else:
-                # HTTP requests use 'content_preview' for first 500 chars
-                content_display = str(call_info.get('content_preview', 'No content')).replace('[', '\\[')
-            
-            # Different labels for local vs HTTP
-            if method == 'LOCAL':
-                details = f"""Method: {method}
+                base_url = f"{parsed.scheme}://{parsed.netloc}"
+                endpoint = parsed.path
+    
+    return base_url, endpoint
+
+
+@lru_cache(maxsize=128)
+def _format_status(method: str, status_code: int) -> str:
+    """Format the status column (emoji + code) for the call list"""
+    if method == "LOCAL":
+        # For LOCAL commands, 0 is success, anything else is error
+        return f"✅ {status_code}" if status_code == 0 else f"❌ {status_code}"
+    # For HTTP requests, 200 is success
+    if status_code == 200:
+        return f"✅ {status_code}"
+    if status_code == 0:
+        return "❌ ERR"
+    return f"⚠ {status_code}"
+
+
+def _render_call_details(call_info: dict) -> Text:
+    """Build the details panel renderable for an API call
+    
+    Returned as a rich Text so the panel never parses markup; URLs and response
+    bodies containing '[' need no escaping.
+    """
+    url = str(call_info.get('url', 'Unknown'))
+    method = str(call_info.get('method', 'UNKN'))
+    status_code = call_info.get('status_code', 0)
+    duration = str(call_info.get('duration_ms', 'Unknown'))
+    size_bytes = str(call_info.get('size_bytes', 'Unknown'))
+    timestamp = str(call_info.get('timestamp', 'Unknown'))
+    
+    # Different status handling for local vs HTTP
+    if method == 'LOCAL':
+        if status_code == 0:
+            status_emoji = "✅"
+            status_text = f"Exit Code: 0 (Success)"
+        else:
+            status_emoji = "❌"
+            status_text = f"Exit Code: {status_code} (Error)"
+    else:
+        status_emoji = "✅" if status_code == 200 else "❌"
+        status_text = f"HTTP Status: {status_code}"
+    
+    # Use preview content (first 500 chars) for debug view; records from elsewhere may carry their own preview
+    content_display = call_info.get('content_preview')
+    if content_display is None:
+        content_display = call_response_text(call_info, 500) or 'No content'
+    content_display = str(content_display)
+    
+    # Different labels for local vs HTTP
+    if method == 'LOCAL':
+        details = f"""Method: {method}
 Command: {url}
 {status_emoji} {status_text}
 Duration: {duration}ms
 Size: {size_bytes} bytes
 Time: {timestamp}
 """
-            else:
-                details = f"""Method: {method}
+    else:
+        details = f"""Method: {method}
 URL: {url}
 {status_emoji} {status_text}
 Duration: {duration}ms
 Size: {size_bytes} bytes
 Time: {timestamp}
 """
-            
-            # Handle command vs curl differently
-            if method == 'LOCAL':
-                details += f"""
+    
+    # Handle command vs curl differently
+    if method == 'LOCAL':
+        details += f"""
 Local Command:
 {url}
 
 Command Output:
 {content_display}"""
-            else:
-                details += f"""
+    else:
+        details += f"""
 cURL Command:
 curl -X {method} -i "{url}"
 
 Response Preview:
 {content_display}"""
-            
-            self.update(details)
+    
+    return Text(details)
+
+
+class ApiCallDetailsPanel(Static):
+    """Right panel showing detailed API call information"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.call_info = None  # Call dict currently displayed, or None for the placeholder
+    
+    def update_call_info(self, call_info: dict, details: Text = None):
+        """Update the displayed API call information
+        
+        Pass pre-rendered details (see _render_call_details) to skip re-rendering.
+        """
+        self.call_info = call_info
+        if call_info:
+            self.update(details if details is not None else _render_call_details(call_info))
         else:
             self.update("Select an API call to view details")
     
@@ -111,11 +173,29 @@ Response Preview:
         return "\n".join(formatted)
 
 
+class ApiCallTable(DataTable):
+    """API call list that reports double-clicked rows"""
+    
+    class RowDoubleClicked(Message):
+        """Posted when a row is double-clicked"""
+        
+        def __init__(self, cursor_row: int):
+            super().__init__()
+            self.cursor_row = cursor_row
+    
+    def on_click(self, event: Click) -> None:
+        """Detect double-clicks using Textual's click chain count"""
+        # DataTable stops row clicks from bubbling, so the screen never sees them
+        row_index = event.style.meta.get("row", -1)
+        if event.chain == 2 and row_index >= 0:
+            self.post_message(self.RowDoubleClicked(row_index))
+
+
 class DebugConsoleScreen(Screen):
     """Screen for viewing API call debug information"""
     
-    CSS = """
-    Screen {
+    DEFAULT_CSS = """
+    DebugConsoleScreen {
         layout: horizontal;
     }
     
@@ -144,17 +224,17 @@ class DebugConsoleScreen(Screen):
     
     def __init__(self, mock_mode: bool = False, **kwargs):
         super().__init__(**kwargs)
-        self.api_call_data = []
-        self.mock_mode = mock_mode
-        self.last_click_time = 0
-        self.last_clicked_row = -1
+        self.api_call_data = []  # Logged call dicts, one per table row
+        self.api_call_details = []  # Rendered details text, parallel to api_call_data
+        self.mock_mode = mock_mode  # Seed the log with mock calls when it is empty
+        self._last_rendered_row = -1  # Row currently shown in the details panel
     
     def compose(self) -> ComposeResult:
         """Create the debug console layout"""
         yield Header()
         with Horizontal():
             # Left panel - API call list
-            api_table = DataTable(id="api_call_list", cursor_type="row")
+            api_table = ApiCallTable(id="api_call_list", cursor_type="row")
             api_table.add_columns("Time", "Method", "Base URL", "Endpoint", "Status", "Size", "Duration")
             yield api_table
             
@@ -169,25 +249,53 @@ class DebugConsoleScreen(Screen):
         # Show initial details
         details_panel = self.query_one("#api_call_details", ApiCallDetailsPanel)
         details_panel.update("Select an API call to view details")
+        self._last_rendered_row = -1
     
     def load_api_calls(self) -> None:
         """Load API calls from registry manager"""
-        from registry_client import registry_manager
-        
         api_table = self.query_one("#api_call_list", DataTable)
         
         # Clear existing data
         api_table.clear()
         self.api_call_data = []
+        self.api_call_details = []
+        self._last_rendered_row = -1
         
         # Load mock data if in mock mode and no real API calls exist
         if self.mock_mode and not registry_manager.api_call_log and not hasattr(registry_manager, '_mock_data_loaded'):
-            from mock_data import mock_debug
             registry_manager.api_call_log.extend(mock_debug.get_mock_calls())
             registry_manager._mock_data_loaded = True
         
-        # Load API calls from registry manager
-        for call in registry_manager.api_call_log:
+        if not registry_manager.api_call_log:
+            # Empty log (e.g. after a purge outside mock mode) - don't leave a stale call showing
+            details_panel = self.query_one("#api_call_details", ApiCallDetailsPanel)
+            details_panel.update_call_info(None)
+            return
+        
+        self._append_api_calls(registry_manager.api_call_log)
+    
+    def load_new_api_calls(self) -> None:
+        """Append API calls logged since the last load"""
+        log = registry_manager.api_call_log
+        loaded = len(self.api_call_data)
+        
+        # The log is trimmed from the front once full, shifting every index; rebuild then
+        if loaded and (len(log) < loaded or log[loaded - 1] is not self.api_call_data[-1]):
+            self.load_api_calls()
+            return
+        
+        self._append_api_calls(list(islice(log, loaded, None)))
+    
+    def _append_api_calls(self, calls) -> None:
+        """Add rows for the given API calls and select the most recent one"""
+        if not calls:
+            return
+        
+        api_table = self.query_one("#api_call_list", DataTable)
+        
+        # Collect rows for a single batched insert
+        rows = []
+        for call in calls:
             # Extract base URL and endpoint from call data
             url = call.get("url", "")
             method = call.get("method", "UNKN")
@@ -198,61 +306,26 @@ class DebugConsoleScreen(Screen):
                 endpoint = call.get("endpoint", url)
             else:
                 # For HTTP requests, extract base URL and endpoint from full URL
-                base_url = "Unknown"
-                endpoint = url
-                
-                if "/v2/" in url:
-                    parts = url.split("/v2/", 1)
-                    base_url = parts[0]  # Everything before /v2/
-                    endpoint_part = parts[1] if len(parts) > 1 else ""
-                    endpoint = "/v2/" + endpoint_part
-                else:
-                    # If no /v2/, try to extract base URL anyway
-                    if "://" in url:
-                        try:
-                            from urllib.parse import urlparse
-                            parsed = urlparse(url)
-                            base_url = f"{parsed.scheme}://{parsed.netloc}"
-                            endpoint = parsed.path
-                        except:
-                            base_url = url
-            
-            # Format size
-            size_bytes = call.get("size_bytes", 0)
-            if size_bytes > 1024:
-                size = f"{size_bytes / 1024:.1f}KB"
-            else:
-                size = f"{size_bytes}B"
+                base_url, endpoint = _split_base_endpoint(url)
             
-            # Status with emoji
-            status_code = call.get("status_code", 0)
-            method = call.get("method", "UNKN")
+            # Size is formatted when logged; seeded mock calls bypass add_api_call
+            size = call.get("size_display") or format_call_size(call.get("size_bytes", 0))
             
-            if method == "LOCAL":
-                # For LOCAL commands, 0 is success, anything else is error
-                if status_code == 0:
-                    status = f"✅ {status_code}"
-                else:
-                    status = f"❌ {status_code}"
-            else:
-                # For HTTP requests, 200 is success
-                if status_code == 200:
-                    status = f"✅ {status_code}"
-                elif status_code == 0:
-                    status = "❌ ERR"
-                else:
-                    status = f"⚠ {status_code}"
+            status = _format_status(method, call.get("status_code", 0))
             
-            api_table.add_row(
+            rows.append((
                 call.get("timestamp", "Unknown"),
-                call.get("method", "UNKN"),
+                method,
                 base_url,
                 endpoint,
                 status,
                 size,
                 f"{call.get('duration_ms', 0):,}ms"
-            )
+            ))
             self.api_call_data.append(call)
+            self.api_call_details.append(_render_call_details(call))
+        
+        api_table.add_rows(rows)
         
         # Auto-select last row (most recent call)
         if self.api_call_data:
@@ -262,40 +335,31 @@ class DebugConsoleScreen(Screen):
     
     def update_details_for_row(self, row_index: int) -> None:
         """Update details panel for given row index"""
+        # Skip re-rendering when the panel already shows this row
+        if row_index == self._last_rendered_row:
+            return
+        
         details_panel = self.query_one("#api_call_details", ApiCallDetailsPanel)
         
         if row_index < len(self.api_call_data):
             call = self.api_call_data[row_index]
-            details_panel.update_call_info(call)
+            details_panel.update_call_info(call, self.api_call_details[row_index])
+            self._last_rendered_row = row_index
     
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Handle API call row highlighting (auto-select)"""
         self.update_details_for_row(event.cursor_row)
     
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
-        """Handle API call selection and double-click detection"""
-        # Only handle events if this is the DebugConsoleScreen
-        if not isinstance(self, DebugConsoleScreen):
-            return
-            
-        import time
-        current_time = time.time()
-        
-        # Double-click detection (within 500ms of previous click on same row)
-        if (current_time - self.last_click_time < 0.5 and 
-            self.last_clicked_row == event.cursor_row and
-            event.cursor_row < len(self.api_call_data)):
-            
-            # Double-click detected - show API detail modal
-            self.show_api_detail_modal(self.api_call_data[event.cursor_row])
-            event.stop()  # Prevent event bubbling
-        else:
-            # Single click - update details
-            self.update_details_for_row(event.cursor_row)
-        
-        # Update click tracking and stop event bubbling
-        self.last_click_time = current_time
-        self.last_clicked_row = event.cursor_row
+        """Handle API call selection"""
+        # Single click - update details (double-clicks are reported by ApiCallTable)
+        self.update_details_for_row(event.cursor_row)
+        event.stop()  # Prevent event bubbling
+    
+    def on_api_call_table_row_double_clicked(self, event: ApiCallTable.RowDoubleClicked) -> None:
+        """Show API detail modal when a call row is double-clicked"""
+        if event.cursor_row < len(self.api_call_data):
+            self.show_api_detail_modal(event.cursor_row)
         event.stop()  # Prevent event bubbling
     
     def on_key(self, event) -> None:
@@ -307,24 +371,18 @@ class DebugConsoleScreen(Screen):
             if api_table.has_focus and hasattr(api_table, 'cursor_coordinate') and api_table.cursor_coordinate:
                 row_index = api_table.cursor_coordinate[0]
                 if row_index < len(self.api_call_data):
-                    self.show_api_detail_modal(self.api_call_data[row_index])
+                    self.show_api_detail_modal(row_index)
                 event.stop()  # Prevent event bubbling
     
-    def show_api_detail_modal(self, call_data: dict) -> None:
-        """Show API call details in modal"""
-        from api_detail_modal import ApiDetailModal
-        
-        # Find the index of the selected call
-        api_table = self.query_one("#api_call_list", DataTable)
-        current_index = api_table.cursor_coordinate[0] if hasattr(api_table, 'cursor_coordinate') and api_table.cursor_coordinate else 0
-        
+    def show_api_detail_modal(self, current_index: int) -> None:
+        """Show the API call at the given row in the detail modal"""
         # Pass all API calls and current index for navigation
         modal = ApiDetailModal(self.api_call_data, current_index)
         self.app.push_screen(modal)
     
     def action_refresh(self) -> None:
         """Refresh API call list"""
-        self.load_api_calls()
+        self.load_new_api_calls()
         self.notify("API call list refreshed")
     
     # def on_mouse_down(self, event: MouseDown) -> None:
@@ -339,8 +397,6 @@ class DebugConsoleScreen(Screen):
     
     def action_purge(self) -> None:
         """Purge all API call data"""
-        from registry_client import registry_manager
-        
         # Clear the registry manager's API call log
         registry_manager.api_call_log.clear()
         
@@ -350,7 +406,6 @@ class DebugConsoleScreen(Screen):
         
         # If in mock mode, immediately reload mock data after purging
         if self.mock_mode:
-            from mock_data import mock_debug
             registry_manager.api_call_log.extend(mock_debug.get_mock_calls())
             registry_manager._mock_data_loaded = True
             self.notify("API call log purged and reseeded with mock data", severity="warning")
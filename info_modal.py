@@ -14,17 +14,22 @@ from textual.binding import Binding
 
 import sys
 import os
+from functools import lru_cache
 
-# Check if running as script from source directory
-if __name__ == "__main__" or os.path.basename(sys.argv[0]).endswith('.py'):
-    app_version = "FROM-SOURCE"
-else:
+
+@lru_cache(maxsize=None)
+def _get_app_version() -> str:
+    """Look up the application version on first use (reads package metadata)"""
+    # Check if running as script from source directory
+    if os.path.basename(sys.argv[0]).endswith('.py'):
+        return "FROM-SOURCE"
+    
     # Try to get installed version
     try:
         from importlib.metadata import version
-        app_version = version("container-registry-card-catalog")
+        return version("container-registry-card-catalog")
     except Exception:
-        app_version = "FROM-SOURCE"
+        return "FROM-SOURCE"
 
 
 class InfoModal(ModalScreen):
@@ -36,6 +41,16 @@ class InfoModal(ModalScreen):
         ("ctrl+q", "quit", "Quit"),
     ]
     
+    # (label, value) rows shown in the dialog; None means the app version
+    _FIELDS = (
+        ("Version:", None),
+        ("Release Date:", "2025-08-28"),
+        ("Author:", "Andrew Potozniak <potozniak@redhat.com>"),
+        ("License:", "MIT + VCL-0.1-Experimental"),
+        ("AIA:", "[EAI Hin R Claude Code v1.0]"),
+        ("Repository:", "github.com/vibe-code-zone/container-registry-card-catalog"),
+    )
+    
     def on_key(self, event) -> None:
         """Handle key presses in modal"""
         if event.key == "enter":
@@ -48,7 +63,7 @@ class InfoModal(ModalScreen):
         """Close the modal"""
         self.dismiss()
     
-    CSS = """
+    DEFAULT_CSS = """
     InfoModal {
         align: center middle;
     }
@@ -110,23 +125,9 @@ class InfoModal(ModalScreen):
                     yield Label("Container Registry Card Catalog - Beta", classes="info_header")
                     yield Label("Serve the Vibes", classes="info_tagline")
                     
-                    yield Label("Version:", classes="info_label")
-                    yield Label(app_version, classes="info_value")
-                    
-                    yield Label("Release Date:", classes="info_label") 
-                    yield Label("2025-08-28", classes="info_value")
-                    
-                    yield Label("Author:", classes="info_label")
-                    yield Label("Andrew Potozniak <potozniak@redhat.com>", classes="info_value")
-                    
-                    yield Label("License:", classes="info_label")
-                    yield Label("MIT + VCL-0.1-Experimental", classes="info_value")
-                    
-                    yield Label("AIA:", classes="info_label")
-                    yield Label("[EAI Hin R Claude Code v1.0]", classes="info_value")
-                    
-                    yield Label("Repository:", classes="info_label")
-                    yield Label("github.com/vibe-code-zone/container-registry-card-catalog", classes="info_value")
+                    for label, value in self._FIELDS:
+                        yield Label(label, classes="info_label")
+                        yield Label(value if value is not None else _get_app_version(), classes="info_value")
                     
                     yield Button("Close", variant="primary", id="info_close_button")
     
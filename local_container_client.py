@@ -14,44 +14,216 @@ Session Date: 2025-08-15
 
 import asyncio
 import json
+import os
+import subprocess
 import time
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+
+try:
+    from registry_client import call_timestamp, registry_manager
+except ImportError:
+    registry_manager = None  # Used standalone; runtime calls just aren't logged
+
+try:
+    # Optional: parses bytes directly and is much faster on large `images` listings
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON, matching orjson.dumps output"""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Podman only serves libpod routes under a version prefix; any 4.x+ service accepts this one
+_LIBPOD_API_PREFIX = '/v4.0.0/libpod'
+
+# Media types used in the manifests built here
+_DOCKER_MANIFEST_MEDIA_TYPE = 'application/vnd.docker.distribution.manifest.v2+json'
+_DOCKER_CONFIG_MEDIA_TYPE = 'application/vnd.docker.container.image.v1+json'
+_DOCKER_LAYER_MEDIA_TYPE = 'application/vnd.docker.image.rootfs.diff.tar.gzip'
+
+# Label keys checked for an image description, in priority order, followed by
+# maintainer/vendor keys used as a fallback
+_DESCRIPTION_LABELS = (
+    'description', 'Description', 'DESCRIPTION',
+    'summary', 'Summary', 'SUMMARY',
+    'io.k8s.description', 'io.openshift.description',
+    'org.label-schema.description', 'org.opencontainers.image.description'
+)
+_MAINTAINER_LABELS = (
+    'maintainer', 'Maintainer', 'MAINTAINER',
+    'vendor', 'Vendor', 'VENDOR',
+    'org.label-schema.vendor', 'org.opencontainers.image.vendor'
+)
+_DESCRIPTION_LABEL_GROUPS = (
+    (_DESCRIPTION_LABELS, frozenset(_DESCRIPTION_LABELS), "{}"),
+    (_MAINTAINER_LABELS, frozenset(_MAINTAINER_LABELS), "Maintained by {}"),
+)
+
+def _digest_short(full_digest_part: str) -> str:
+    """Short digest used as the tag name for a repo@sha256:... reference"""
+    # For tag name, use just the hash part without sha256: prefix
+    if full_digest_part.startswith('sha256:'):
+        return full_digest_part[7:19]  # Skip 'sha256:' and take first 12 chars of hash
+    return full_digest_part[:12]  # Fallback
+
+
+def _union_refs(repo_tags: List[str], names: List[str]) -> List[str]:
+    """Combine RepoTags and Names for a complete picture, removing duplicates while preserving order"""
+    # Podman usually reports identical lists (or only one of them); skip the merge then
+    if not names or names == repo_tags:
+        return repo_tags
+    if not repo_tags:
+        return names
+    return list(dict.fromkeys(repo_tags + names))
+
+
+def _iter_image_refs(image: Dict[str, Any], include_digests: bool = False) -> Iterator[Tuple[str, str, str, Optional[str]]]:
+    """Yield (repo_name, tag, ref, digest) for every name an image is known by
+    
+    Tag references (repo:tag) yield digest=None; digest references (repo@sha256:...) yield the
+    short digest as the tag and the sha256:... part as digest. RepoDigests are only consulted
+    for images without tags/names, unless include_digests is set.
+    """
+    all_tags = _union_refs(image.get('RepoTags') or [], image.get('Names') or [])
+    
+    for ref in all_tags:
+        # One scan finds the separator; repo names can't contain '@', so it's the digest one
+        repo_name, sep, full_digest_part = ref.partition('@')
+        if sep and full_digest_part.startswith('sha256:'):
+            yield repo_name, full_digest_part[7:19], ref, full_digest_part
+        else:
+            repo_name, sep, tag = ref.rpartition(':')
+            if sep:
+                yield repo_name, tag, ref, None
+            else:
+                yield ref, 'latest', ref, None
+    
+    if all_tags and not include_digests:
+        return
+    
+    for ref in image.get('RepoDigests') or []:
+        repo_name, sep, full_digest_part = ref.partition('@')
+        if sep:
+            yield repo_name, _digest_short(full_digest_part), ref, full_digest_part
+
+def _build_repo_index(images: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+    """Map each repository name to the indexes of the images referencing it"""
+    repo_index: Dict[str, List[int]] = {}
+    for i, image in enumerate(images):
+        for repo_name, _, _, _ in _iter_image_refs(image, include_digests=True):
+            indexes = repo_index.setdefault(repo_name, [])
+            if not indexes or indexes[-1] != i:  # Several refs of one image may share a repo
+                indexes.append(i)
+    return repo_index
+
+
+def _images_for_repository(result: Dict[str, Any], repository: str) -> List[Dict[str, Any]]:
+    """Images from a _list_images() result that reference the repository (all if unindexed)"""
+    images = result.get('data', [])
+    repo_index = result.get('repo_index')
+    if repo_index is None:
+        return images
+    return [images[i] for i in repo_index.get(repository, ())]
+
+
+class _RepoAggregate:
+    """Per-repository totals collected while walking the local image list"""
+    
+    __slots__ = ('tags', 'tag_details', 'total_size', 'image_count', 'last_updated',
+                 'latest_hash', 'description', 'description_created')
+    
+    def __init__(self):
+        self.tags = []
+        self.tag_details = {}  # Store full tag info including digests
+        self.total_size = 0
+        self.image_count = 0
+        self.last_updated = None
+        self.latest_hash = None  # Digest of the most recently created image
+        self.description = None  # Store description from labels
+        self.description_created = -1  # Created time of the image the description came from
+
+@lru_cache(maxsize=4096)
+def _format_elapsed(timestamp_minute: int, now_minute: int) -> str:
+    """Format the time between two Unix-minute buckets as "N days/hours/minutes ago"
+    
+    Images built together share a creation minute, so a whole listing mostly hits the cache.
+    """
+    # Split like a timedelta (days, minutes)
+    days, minutes = divmod(now_minute - timestamp_minute, 1440)
+    
+    if days > 0:
+        return f"{days} days ago"
+    elif minutes >= 60:
+        hours = minutes // 60
+        return f"{hours} hours ago"
+    elif minutes > 0:
+        return f"{minutes} minutes ago"
+    else:
+        return "Just now"
 
 
 class LocalContainerClient:
     """Client for local container runtimes (podman/docker)"""
     
+    # `images --format json` output, shared across clients per runtime for a short window
+    # so back-to-back repository/tag/manifest lookups reuse one runtime call
+    IMAGES_CACHE_TTL = 2.0
+    _images_cache: Dict[str, Tuple[float, List[Dict[str, Any]], Dict[str, List[int]]]] = {}
+    _images_locks: Dict[str, asyncio.Lock] = {}
+    
+    # Pending `inspect` requests per runtime; those arriving within the window share one call
+    INSPECT_BATCH_WINDOW = 0.01
+    _inspect_batches: Dict[str, Dict[str, asyncio.Future]] = {}
+    _inspect_tasks: set = set()
+    
+    # Commands with small output run as a blocking subprocess.run on this pool; that is cheaper
+    # per call than asyncio's subprocess transport. `images` keeps the async transport.
+    SMALL_OUTPUT_COMMANDS = ('version', 'inspect')
+    _small_exec_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='runtime-cmd')
+    
     def __init__(self, runtime: str = 'podman'):
         self.runtime = runtime
         self.cmd = runtime
         self.base_url = f"local://{runtime}"
+        self._api_client: Optional[httpx.AsyncClient] = None  # Kept-alive Podman API connection, opened on first use
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
     
-    def _format_timestamp(self, timestamp: int) -> str:
-        """Format Unix timestamp to human readable format"""
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the Podman API connection, if one was opened"""
+        client, self._api_client = self._api_client, None
+        if client is not None:
+            await client.aclose()
+    
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+    
+    def _format_timestamp(self, timestamp: int, now: Optional[float] = None) -> str:
+        """Format Unix timestamp to human readable format
+        
+        Pass `now` (time.time()) when formatting many timestamps to share one clock read.
+        """
         if not timestamp or timestamp == 0:
             return "Unknown"
         
         try:
-            # Convert to datetime
-            dt = datetime.fromtimestamp(timestamp)
-            now = datetime.now()
-            
-            # Calculate time difference
-            diff = now - dt
-            
-            if diff.days > 0:
-                return f"{diff.days} days ago"
-            elif diff.seconds > 3600:
-                hours = diff.seconds // 3600
-                return f"{hours} hours ago"
-            elif diff.seconds > 60:
-                minutes = diff.seconds // 60
-                return f"{minutes} minutes ago"
-            else:
-                return "Just now"
-        except (ValueError, OSError, OverflowError):
+            # The output only changes on minute boundaries, so format (and cache) per minute
+            return _format_elapsed(int(timestamp) // 60, int(time.time() if now is None else now) // 60)
+        except (ValueError, OverflowError, TypeError):
             return "Unknown"
     
     def _format_size(self, size_bytes: int) -> str:
@@ -60,15 +232,11 @@ class LocalContainerClient:
             return "Unknown"
         
         try:
-            # Convert bytes to human readable format
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if size_bytes < 1024.0:
-                    if unit == 'B':
-                        return f"{int(size_bytes)} {unit}"
-                    else:
-                        return f"{size_bytes:.1f} {unit}"
-                size_bytes /= 1024.0
-            return f"{size_bytes:.1f} PB"
+            if size_bytes < 1024:
+                return f"{int(size_bytes)} B"
+            # Each unit is 2**10 of the previous one, so the bit length picks it directly
+            unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(self._SIZE_UNITS) - 1)
+            return f"{size_bytes / (1 << (10 * unit_index)):.1f} {self._SIZE_UNITS[unit_index]}"
         except (ValueError, TypeError):
             return "Unknown"
     
@@ -76,88 +244,155 @@ class LocalContainerClient:
         """Extract description from image labels"""
         if not labels:
             return None
-            
-        # Try common label keys for description
-        description_labels = [
-            'description', 'Description', 'DESCRIPTION',
-            'summary', 'Summary', 'SUMMARY',
-            'io.k8s.description', 'io.openshift.description',
-            'org.label-schema.description', 'org.opencontainers.image.description'
-        ]
         
-        for label_key in description_labels:
-            if label_key in labels and labels[label_key]:
-                desc = labels[label_key].strip()
-                if desc and desc != 'null' and desc != '""':
-                    return desc
-        
-        # Try to get maintainer or vendor info as fallback
-        maintainer_labels = [
-            'maintainer', 'Maintainer', 'MAINTAINER',
-            'vendor', 'Vendor', 'VENDOR',
-            'org.label-schema.vendor', 'org.opencontainers.image.vendor'
-        ]
+        # Most images carry none of these labels; one set intersection rules them out
+        for label_keys, label_set, template in _DESCRIPTION_LABEL_GROUPS:
+            hits = label_set.intersection(labels)
+            if not hits:
+                continue
+            for label_key in label_keys:
+                if label_key in hits and labels[label_key]:
+                    value = labels[label_key].strip()
+                    if value and value != 'null' and value != '""':
+                        return template.format(value)
         
-        for label_key in maintainer_labels:
-            if label_key in labels and labels[label_key]:
-                maintainer = labels[label_key].strip()
-                if maintainer and maintainer != 'null' and maintainer != '""':
-                    return f"Maintained by {maintainer}"
+        return None
+    
+    def _api_socket_path(self) -> Optional[str]:
+        """Locate the Podman REST API socket, or None if the service isn't available"""
+        if self.runtime != 'podman':
+            return None
         
+        candidates = []
+        container_host = os.environ.get('CONTAINER_HOST', '')
+        if container_host.startswith('unix://'):
+            candidates.append(container_host[len('unix://'):])
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        if runtime_dir:
+            candidates.append(os.path.join(runtime_dir, 'podman', 'podman.sock'))
+        candidates.append('/run/podman/podman.sock')  # Rootful service
+        
+        for path in candidates:
+            if os.path.exists(path):
+                return path
+        return None
+    
+    def _api_endpoint(self, args: List[str]) -> Optional[str]:
+        """Map a CLI invocation to the libpod endpoint returning the same JSON, if there is one"""
+        if args == ['images', '--format', 'json']:
+            return f"{_LIBPOD_API_PREFIX}/images/json"
+        if args == ['version', '--format', 'json']:
+            return f"{_LIBPOD_API_PREFIX}/version"
+        if len(args) == 2 and args[0] == 'inspect':
+            return f"{_LIBPOD_API_PREFIX}/images/{quote(args[1], safe='')}/json"
         return None
     
+    def _log_call(self, args: List[str], status_code: int, output: str, response_time: float) -> None:
+        """Record a runtime call in the debug console's API log"""
+        if registry_manager is None:
+            return
+        
+        # Create API call entry in the same format as HTTP calls
+        registry_manager.add_api_call({
+            'method': 'LOCAL',
+            'url': f"{self.runtime} {' '.join(args)}",
+            'status_code': status_code,
+            'duration_ms': int(response_time * 1000),
+            'response_content_full': output,
+            'timestamp': call_timestamp(),
+            'base_url': self.base_url,
+            'endpoint': args[0] if args else 'unknown',
+            'size_bytes': len(output)
+        })
+    
+    async def _run_api_request(self, socket_path: str, endpoint: str, args: List[str]) -> Optional[Dict[str, Any]]:
+        """Serve a command from the Podman REST API; None means fall back to the CLI"""
+        start_time = time.perf_counter()
+        
+        # One connection per client, so a listing's inspect calls share the socket
+        if self._api_client is None or self._api_client.is_closed:
+            self._api_client = httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=socket_path), timeout=10.0)
+        
+        try:
+            response = await self._api_client.get(f"http://d{endpoint}")
+        except httpx.HTTPError:
+            return None  # Socket present but service not answering
+        
+        # Log with CLI-style exit codes so the debug console treats it like a command
+        self._log_call(args, 0 if response.is_success else response.status_code,
+                       response.text, time.perf_counter() - start_time)
+        
+        if not response.is_success:
+            # E.g. an API version without this route; the CLI still answers
+            if registry_manager is not None and registry_manager.tui_debug_logger:
+                registry_manager.tui_debug_logger.debug("Podman API request failed - falling back to CLI",
+                                                        endpoint=endpoint,
+                                                        status_code=response.status_code)
+            return None
+        
+        try:
+            data = _json_loads(response.content)
+        except ValueError:
+            return {'error': f"{self.runtime} API returned invalid JSON", 'status_code': 500}
+        
+        # Match the CLI's JSON shape so callers can't tell the difference
+        if args[0] == 'inspect':
+            data = [data]  # `inspect` prints a list even for a single image
+        elif args[0] == 'version':
+            data = {'Client': data}  # `version` nests the local version under Client
+        return {'data': data, 'status_code': 200}
+    
+    def _run_command_sync_in_thread(self, cmd: List[str]) -> Tuple[int, bytes, bytes]:
+        """Run a command to completion on the calling (pool) thread"""
+        completed = subprocess.run(cmd, capture_output=True, check=False)
+        return completed.returncode, completed.stdout, completed.stderr
+    
     async def _run_command(self, args: List[str]) -> Dict[str, Any]:
         """Run container runtime command and return parsed output"""
-        start_time = time.time()
+        # Prefer the Podman service socket when available - no fork/exec per call
+        endpoint = self._api_endpoint(args)
+        if endpoint:
+            socket_path = self._api_socket_path()
+            if socket_path:
+                result = await self._run_api_request(socket_path, endpoint, args)
+                if result is not None:
+                    return result
+        
+        start_time = time.perf_counter()
         cmd = [self.cmd] + args
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout_bytes, stderr_bytes = await process.communicate()
+            if args and args[0] in self.SMALL_OUTPUT_COMMANDS:
+                returncode, stdout_bytes, stderr_bytes = await asyncio.get_running_loop().run_in_executor(
+                    self._small_exec_pool, self._run_command_sync_in_thread, cmd)
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                
+                stdout_bytes, stderr_bytes = await process.communicate()
+                returncode = process.returncode
             stdout = stdout_bytes.decode('utf-8') if stdout_bytes else ""
             stderr = stderr_bytes.decode('utf-8') if stderr_bytes else ""
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             
             # Log the API call for debug console
-            try:
-                from registry_client import registry_manager
-                status_code = process.returncode
-                
-                # Create API call entry in the same format as HTTP calls
-                api_call = {
-                    'method': 'LOCAL',
-                    'url': f"{self.runtime} {' '.join(args)}",
-                    'status_code': status_code,
-                    'response_size': len(stdout) if stdout else len(stderr),
-                    'duration_ms': int(response_time * 1000),
-                    'response_content': stdout[:500] if stdout else stderr[:500],
-                    'response_content_full': stdout if stdout else stderr,
-                    'timestamp': time.strftime("%H:%M:%S.") + f"{int((time.time() % 1) * 1000):03d}",
-                    'base_url': f'local://{self.runtime}',
-                    'endpoint': args[0] if args else 'unknown',
-                    'size_bytes': len(stdout) if stdout else len(stderr)
-                }
-                registry_manager.add_api_call(api_call)
-            except ImportError:
-                pass  # Ignore if registry_manager not available
+            self._log_call(args, returncode, stdout if stdout else stderr, response_time)
             
-            if process.returncode != 0:
+            if returncode != 0:
                 return {
                     'error': f"{self.runtime} command failed",
                     'stderr': stderr,
-                    'status_code': process.returncode
+                    'status_code': returncode
                 }
             
-            # Try to parse JSON output
-            if stdout.strip():
+            # Try to parse JSON output (from the raw bytes - orjson skips the decode)
+            if stdout_bytes and stdout_bytes.strip():
                 try:
-                    return {'data': json.loads(stdout), 'status_code': 200}
-                except json.JSONDecodeError:
+                    return {'data': _json_loads(stdout_bytes), 'status_code': 200}
+                except ValueError:
                     return {'data': stdout.strip(), 'status_code': 200}
             
             return {'data': [], 'status_code': 200}
@@ -168,6 +403,81 @@ class LocalContainerClient:
                 'status_code': 500
             }
     
+    async def _list_images(self) -> Dict[str, Any]:
+        """Run `images --format json`, reusing a result fetched within IMAGES_CACHE_TTL seconds
+        
+        Successful results also carry 'repo_index': repository name -> indexes into the image
+        list of every image referencing it (tags, names or digests).
+        """
+        cached = self._images_cache.get(self.runtime)
+        if cached and time.monotonic() - cached[0] < self.IMAGES_CACHE_TTL:
+            return {'data': cached[1], 'status_code': 200, 'repo_index': cached[2]}
+        
+        lock = self._images_locks.get(self.runtime)
+        if lock is None:
+            lock = self._images_locks[self.runtime] = asyncio.Lock()
+        
+        async with lock:
+            # Another caller may have refreshed the cache while we waited
+            cached = self._images_cache.get(self.runtime)
+            if cached and time.monotonic() - cached[0] < self.IMAGES_CACHE_TTL:
+                return {'data': cached[1], 'status_code': 200, 'repo_index': cached[2]}
+            
+            result = await self._run_command(['images', '--format', 'json'])
+            if 'error' not in result and isinstance(result.get('data'), list):
+                result['repo_index'] = _build_repo_index(result['data'])
+                self._images_cache[self.runtime] = (time.monotonic(), result['data'], result['repo_index'])
+            return result
+    
+    async def _inspect_image(self, image_id: str) -> Dict[str, Any]:
+        """Inspect one image, coalescing concurrent requests into a single `inspect` call"""
+        loop = asyncio.get_running_loop()
+        batch = self._inspect_batches.get(self.runtime)
+        if batch is None:
+            batch = self._inspect_batches[self.runtime] = {}
+            task = loop.create_task(self._flush_inspect_batch(batch))
+            self._inspect_tasks.add(task)  # Keep a reference until the batch is done
+            task.add_done_callback(self._inspect_tasks.discard)
+        
+        future = batch.get(image_id)
+        if future is None:
+            future = batch[image_id] = loop.create_future()
+        # Shield so one cancelled caller doesn't cancel the result for others waiting on it
+        return await asyncio.shield(future)
+    
+    async def _flush_inspect_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        """Run the `inspect` call(s) for a batch of image IDs and resolve their futures"""
+        await asyncio.sleep(self.INSPECT_BATCH_WINDOW)
+        # Requests from here on start a new batch
+        if self._inspect_batches.get(self.runtime) is batch:
+            del self._inspect_batches[self.runtime]
+        
+        image_ids = list(batch)
+        results = {}
+        try:
+            # The REST API inspects one image per request, so only the CLI benefits from batching
+            if len(image_ids) > 1 and self._api_socket_path() is None:
+                result = await self._run_command(['inspect', *image_ids])
+                if 'error' not in result and isinstance(result.get('data'), list):
+                    for entry in result['data']:
+                        results[entry.get('Id')] = {'data': [entry], 'status_code': 200}
+            
+            # Anything not answered by the batch (single image, REST API, or a failed batch where
+            # one bad ID fails the whole command) is inspected on its own
+            missing = [image_id for image_id in image_ids if image_id not in results]
+            for image_id, result in zip(missing, await asyncio.gather(
+                    *(self._run_command(['inspect', image_id]) for image_id in missing))):
+                results[image_id] = result
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        
+        for image_id, future in batch.items():
+            if not future.done():
+                future.set_result(results[image_id])
+    
     async def check_health(self) -> Dict[str, Any]:
         """Check if the container runtime is available"""
         result = await self._run_command(['version', '--format', 'json'])
@@ -190,28 +500,10 @@ class LocalContainerClient:
             'response_time': 0.1  # Local is always fast
         }
     
-    async def get_repositories(self) -> Dict[str, Any]:
-        """Get list of repositories from local images"""
-        result = await self._run_command(['images', '--format', 'json'])
-        
-        if 'error' in result:
-            return result
-        
-        images = result.get('data', [])
-        if not isinstance(images, list):
-            return {'error': 'Unexpected response format', 'status_code': 500}
-        
+    def _aggregate_repositories(self, images: List[Dict[str, Any]]) -> Dict[str, _RepoAggregate]:
+        """Group local images into per-repository totals (plus an <orphaned> pseudo-repository)"""
         # Group images by repository
-        repos = defaultdict(lambda: {
-            'name': '',
-            'tags': [],
-            'tag_details': {},  # Store full tag info including digests
-            'image_refs': {},   # Store inspectable image references (full IDs or repo:tag)
-            'total_size': 0,
-            'image_count': 0,
-            'last_updated': None,
-            'description': None  # Store description from labels
-        })
+        repos: Dict[str, _RepoAggregate] = {}
         
         orphaned_images = []
         
@@ -224,18 +516,8 @@ class LocalContainerClient:
             image_id = image.get('Id', '')[:12]  # Short ID
             labels = image.get('Labels', {}) or {}
             
-            # Extract description from labels
-            image_description = self._extract_description_from_labels(labels)
-            
-            # Combine RepoTags and Names for a complete picture, removing duplicates
-            all_tags = list(repo_tags) if repo_tags else []
-            if names:
-                all_tags.extend(names)
-            # Remove duplicates while preserving order
-            all_tags = list(dict.fromkeys(all_tags))
-            
             # Handle orphaned images
-            if not all_tags and not repo_digests:
+            if not repo_tags and not names and not repo_digests:
                 # Truly orphaned image: <none> <none>
                 orphaned_images.append({
                     'image_id': image_id,
@@ -245,137 +527,87 @@ class LocalContainerClient:
                 })
                 continue
             
-            # Handle both tagged and digest-only images from all_tags (RepoTags + Names)
-            if all_tags:
-                tag_processed = False  # Track if we processed any normal tags
-                
-                for repo_tag in all_tags:
-                    if '@sha256:' in repo_tag:
-                        # This is a digest reference - handle like repo_digests
-                        if '@' in repo_tag:
-                            repo_name = repo_tag.split('@')[0]
-                            full_digest_part = repo_tag.split('@')[1]  # Just the sha256:... part
-                            # For tag name, use just the hash part without sha256: prefix
-                            if full_digest_part.startswith('sha256:'):
-                                digest_short = full_digest_part[7:19]  # Skip 'sha256:' and take first 12 chars of hash
-                            else:
-                                digest_short = full_digest_part[:12]  # Fallback
-                            
-                            repos[repo_name]['name'] = repo_name
-                            if digest_short not in repos[repo_name]['tags']:
-                                repos[repo_name]['tags'].append(digest_short)
-                            repos[repo_name]['tag_details'][digest_short] = {
-                                'full_digest': full_digest_part,  # Store just sha256:... without repo prefix
-                                'type': 'digest'
-                            }
-                            # Store the full digest reference for inspection
-                            repos[repo_name]['image_refs'][digest_short] = repo_tag
-                            repos[repo_name]['total_size'] += size
-                            repos[repo_name]['image_count'] += 1
-                            
-                            if repos[repo_name]['last_updated'] is None or created > repos[repo_name]['last_updated']:
-                                repos[repo_name]['last_updated'] = created
-                    else:
-                        # This is a normal tag reference
-                        tag_processed = True
-                        
-                        if ':' in repo_tag:
-                            repo_name, tag = repo_tag.rsplit(':', 1)
-                        else:
-                            repo_name, tag = repo_tag, 'latest'
-                        
-                        repos[repo_name]['name'] = repo_name
-                        # Only add tag if not already present
-                        if tag not in repos[repo_name]['tags']:
-                            repos[repo_name]['tags'].append(tag)
-                        repos[repo_name]['tag_details'][tag] = {
-                            'full_digest': f"sha256:{image.get('Id', '')}",
-                            'type': 'tag'
-                        }
-                        # Store the repo:tag for inspection (this is what podman knows about)
-                        repos[repo_name]['image_refs'][tag] = repo_tag
-                        repos[repo_name]['total_size'] += size
-                        repos[repo_name]['image_count'] += 1
-                        
-                        # Store description from the most recent image
-                        if image_description and (repos[repo_name]['description'] is None or created > repos[repo_name]['last_updated']):
-                            repos[repo_name]['description'] = image_description
-                        
-                        if repos[repo_name]['last_updated'] is None or created > repos[repo_name]['last_updated']:
-                            repos[repo_name]['last_updated'] = created
+            # Extract description from labels (only tagged images use it)
+            image_description = self._extract_description_from_labels(labels) if repo_tags or names else None
             
-            # Handle additional digest-only images from repo_digests (if not already processed via Names)
-            elif not all_tags and repo_digests:
-                for digest in repo_digests:
-                    if '@' in digest:
-                        repo_name = digest.split('@')[0]
-                        full_digest_part = digest.split('@')[1]  # Just the sha256:... part
-                        # For tag name, use just the hash part without sha256: prefix
-                        if full_digest_part.startswith('sha256:'):
-                            digest_short = full_digest_part[7:19]  # Skip 'sha256:' and take first 12 chars of hash
-                        else:
-                            digest_short = full_digest_part[:12]  # Fallback
-                        
-                        repos[repo_name]['name'] = repo_name
-                        repos[repo_name]['tags'].append(digest_short)
-                        repos[repo_name]['tag_details'][digest_short] = {
-                            'full_digest': full_digest_part,  # Store just sha256:... without repo prefix
-                            'type': 'digest'
-                        }
-                        # Store the full digest reference for inspection
-                        repos[repo_name]['image_refs'][digest_short] = digest
-                        repos[repo_name]['total_size'] += size
-                        repos[repo_name]['image_count'] += 1
-                        
-                        if repos[repo_name]['last_updated'] is None or created > repos[repo_name]['last_updated']:
-                            repos[repo_name]['last_updated'] = created
+            # Handle both tagged and digest-only images (RepoTags + Names, else RepoDigests)
+            for repo_name, tag, _, digest in _iter_image_refs(image):
+                if digest is not None:
+                    tag_detail = {
+                        'full_digest': digest,  # Store just sha256:... without repo prefix
+                        'type': 'digest'
+                    }
+                else:
+                    tag_detail = {
+                        'full_digest': f"sha256:{image.get('Id', '')}",
+                        'type': 'tag'
+                    }
+                
+                repo = repos.get(repo_name)
+                if repo is None:
+                    repo = repos[repo_name] = _RepoAggregate()
+                # Only add tag if not already present (tag_details holds the same keys, with O(1) lookup)
+                if tag not in repo.tag_details:
+                    repo.tags.append(tag)
+                repo.tag_details[tag] = tag_detail
+                repo.total_size += size
+                repo.image_count += 1
+                
+                # Store description from the most recent tagged image that has one
+                if digest is None and image_description and created > repo.description_created:
+                    repo.description = image_description
+                    repo.description_created = created
+                
+                if repo.last_updated is None or created > repo.last_updated:
+                    repo.last_updated = created
+                    repo.latest_hash = tag_detail['full_digest']
         
         # Add orphaned images as a special repository
         if orphaned_images:
-            repos['<orphaned>'] = {
-                'name': '<orphaned>',
-                'tags': ['<none>'],
-                'total_size': sum(img['size'] for img in orphaned_images),
-                'image_count': len(orphaned_images),
-                'last_updated': max(img['created'] for img in orphaned_images),
-                'orphaned_images': orphaned_images
-            }
+            orphaned = repos['<orphaned>'] = _RepoAggregate()
+            orphaned.tags.append('<none>')
+            orphaned.total_size = sum(img['size'] for img in orphaned_images)
+            orphaned.image_count = len(orphaned_images)
+            orphaned.last_updated = max(img['created'] for img in orphaned_images)
+            orphaned.description = f"{orphaned.image_count} images, 1 unique tags"
+        
+        return repos
+    
+    def _format_repository(self, repo_name: str, repo_data: _RepoAggregate, now: float) -> Dict[str, Any]:
+        """Build the UI row for one aggregated repository"""
+        # Get recent tags (exclude 'latest', take up to 3)
+        recent_tags = [tag for tag in repo_data.tags if tag != 'latest'][:3]
+        recent_tags_display = ', '.join(recent_tags) if recent_tags else 'No recent tags'
         
-        # Convert to list format expected by the UI
-        repo_list = []
-        for repo_name, repo_data in repos.items():
-            # Get recent tags (exclude 'latest', take up to 3)
-            all_tags = repo_data['tags']
-            recent_tags = [tag for tag in all_tags if tag != 'latest'][:3]
-            recent_tags_display = ', '.join(recent_tags) if recent_tags else 'No recent tags'
-            
-            # Get the most recent image ID for latest hash and description
-            latest_image_id = None
-            description = repo_data.get('description', f"{repo_data['image_count']} images, {len(set(repo_data['tags']))} unique tags")
-            
-            tag_details = repo_data.get('tag_details', {})
-            if tag_details:
-                # Find the tag with the most recent creation time
-                latest_tag = max(tag_details.keys(), 
-                                key=lambda t: repo_data.get('creation_times', {}).get(t, 0), 
-                                default=None)
-                if latest_tag:
-                    latest_image_id = tag_details[latest_tag].get('full_digest', 'Unknown')
-            
-            repo_list.append({
-                'name': repo_name,
-                'tag_count': len(set(repo_data['tags'])),  # Unique tags
-                'recent_tags': recent_tags,
-                'recent_tags_display': recent_tags_display,
-                'tag_details': tag_details,  # Include full tag details
-                'size': self._format_size(repo_data['total_size']),
-                'last_updated': self._format_timestamp(repo_data['last_updated'] or 0),
-                'description': description,
-                'latest_hash': latest_image_id or 'Unknown'
-            })
-        
-        # Sort by repository name (alphabetical)
-        repo_list.sort(key=lambda x: x['name'].lower())
+        return {
+            'name': repo_name,
+            'tag_count': len(repo_data.tags),  # Tags are already unique
+            'recent_tags': recent_tags,
+            'recent_tags_display': recent_tags_display,
+            'tag_details': repo_data.tag_details,  # Include full tag details
+            'size': self._format_size(repo_data.total_size),
+            'last_updated': self._format_timestamp(repo_data.last_updated or 0, now),
+            'description': repo_data.description,
+            'latest_hash': repo_data.latest_hash or 'Unknown'
+        }
+    
+    async def get_repositories(self) -> Dict[str, Any]:
+        """Get list of repositories from local images"""
+        result = await self._list_images()
+        
+        if 'error' in result:
+            return result
+        
+        images = result.get('data', [])
+        if not isinstance(images, list):
+            return {'error': 'Unexpected response format', 'status_code': 500}
+        
+        repos = self._aggregate_repositories(images)
+        
+        # Sort by repository name (alphabetical), formatting each row straight into place
+        now = time.time()
+        repo_list = [self._format_repository(name, repos[name], now)
+                     for name in sorted(repos, key=str.lower)]
         
         return {
             'data': repo_list,
@@ -385,13 +617,14 @@ class LocalContainerClient:
     
     async def get_tags(self, repository: str) -> Dict[str, Any]:
         """Get tags for a specific repository"""
-        result = await self._run_command(['images', '--format', 'json'])
+        result = await self._list_images()
         
         if 'error' in result:
             return result
         
         images = result.get('data', [])
         tags = []
+        now = time.time()
         
         if repository == '<orphaned>':
             # Handle orphaned images specially
@@ -410,7 +643,7 @@ class LocalContainerClient:
                         'registry_url': f"local://{self.runtime}",
                         'image_id': image_id_short,
                         'size': self._format_size(image.get('Size', 0)),
-                        'created': self._format_timestamp(created_timestamp),
+                        'created': self._format_timestamp(created_timestamp, now),
                         'created_timestamp': created_timestamp,  # Keep raw timestamp for sorting
                         'digest': 'sha256:' + image.get('Id', ''),
                         'digest_short': 'sha256:' + image.get('Id', '')[:12],
@@ -418,7 +651,7 @@ class LocalContainerClient:
                     })
                 elif not repo_tags and repo_digests:
                     # Untagged but has digest - use image ID as unique tag name
-                    original_repo = repo_digests[0].split('@')[0] if repo_digests else 'unknown'
+                    original_repo = repo_digests[0].partition('@')[0] if repo_digests else 'unknown'
                     created_timestamp = image.get('Created', 0)
                     tags.append({
                         'name': f'<none>:{image_id_short}',
@@ -427,103 +660,36 @@ class LocalContainerClient:
                         'registry_url': f"local://{self.runtime}",
                         'image_id': image_id_short,
                         'size': self._format_size(image.get('Size', 0)),
-                        'created': self._format_timestamp(created_timestamp),
+                        'created': self._format_timestamp(created_timestamp, now),
                         'created_timestamp': created_timestamp,  # Keep raw timestamp for sorting
                         'digest': repo_digests[0] if repo_digests else 'sha256:' + image.get('Id', ''),
                         'type': 'untagged',
                         'original_repo': original_repo
                     })
         else:
-            # Handle normal repository
-            for image in images:
-                repo_tags = image.get('RepoTags') or []
-                repo_digests = image.get('RepoDigests') or []
-                names = image.get('Names') or []
+            # Handle normal repository: tagged images (RepoTags + Names), else digest-only ones
+            for image in _images_for_repository(result, repository):
                 image_id_short = image.get('Id', '')[:12]
                 
-                # Combine RepoTags and Names for a complete picture, removing duplicates
-                all_tags = list(repo_tags) if repo_tags else []
-                if names:
-                    all_tags.extend(names)
-                # Remove duplicates while preserving order
-                all_tags = list(dict.fromkeys(all_tags))
-                
-                # Check tagged images from all_tags (RepoTags + Names)
-                if all_tags:
-                    for repo_tag in all_tags:
-                        if '@sha256:' in repo_tag:
-                            # This is a digest reference
-                            if '@' in repo_tag:
-                                repo_name = repo_tag.split('@')[0]
-                                if repo_name == repository:
-                                    full_digest_part = repo_tag.split('@')[1]
-                                    if full_digest_part.startswith('sha256:'):
-                                        digest_short = full_digest_part[7:19]  # Skip 'sha256:' and take first 12 chars
-                                    else:
-                                        digest_short = full_digest_part[:12]
-                                    
-                                    created_timestamp = image.get('Created', 0)
-                                    tags.append({
-                                        'name': digest_short,
-                                        'tag': digest_short,
-                                        'repository': repository,
-                                        'registry_url': f"local://{self.runtime}",
-                                        'image_id': image_id_short,
-                                        'size': self._format_size(image.get('Size', 0)),
-                                        'created': self._format_timestamp(created_timestamp),
-                                        'created_timestamp': created_timestamp,
-                                        'digest': repo_tag,  # Full digest reference
-                                        'digest_short': f"sha256:{digest_short}",
-                                        'manifest_media_type': 'application/vnd.docker.distribution.manifest.v2+json'
-                                    })
-                        else:
-                            # This is a normal tag reference
-                            if ':' in repo_tag:
-                                repo_name, tag = repo_tag.rsplit(':', 1)
-                            else:
-                                repo_name, tag = repo_tag, 'latest'
-                            
-                            if repo_name == repository:
-                                created_timestamp = image.get('Created', 0)
-                                tags.append({
-                                    'name': tag,
-                                    'tag': tag,
-                                    'repository': repository,
-                                    'registry_url': f"local://{self.runtime}",
-                                    'image_id': image_id_short,
-                                    'size': self._format_size(image.get('Size', 0)),
-                                    'created': self._format_timestamp(created_timestamp),
-                                    'created_timestamp': created_timestamp,
-                                    'digest': f"sha256:{image.get('Id', '')}",
-                                    'digest_short': f"sha256:{image.get('Id', '')[:12]}",
-                                    'manifest_media_type': 'application/vnd.docker.distribution.manifest.v2+json'
-                                })
-                
-                # Check digest-only images from repo_digests (if not already processed via all_tags)
-                elif not all_tags and repo_digests:
-                    for digest in repo_digests:
-                        if '@' in digest:
-                            repo_name = digest.split('@')[0]
-                            if repo_name == repository:
-                                full_digest_part = digest.split('@')[1]
-                                if full_digest_part.startswith('sha256:'):
-                                    digest_short = full_digest_part[7:19]  # Skip 'sha256:' and take first 12 chars
-                                else:
-                                    digest_short = full_digest_part[:12]
-                                
-                                created_timestamp = image.get('Created', 0)
-                                tags.append({
-                                    'name': digest_short,
-                                    'tag': digest_short,
-                                    'repository': repository,
-                                    'registry_url': f"local://{self.runtime}",
-                                    'image_id': image_id_short,
-                                    'size': self._format_size(image.get('Size', 0)),
-                                    'created': self._format_timestamp(created_timestamp),
-                                    'created_timestamp': created_timestamp,
-                                    'digest': digest,
-                                    'manifest_media_type': 'application/vnd.docker.distribution.manifest.v2+json'
-                                })
+                for repo_name, tag, ref, digest in _iter_image_refs(image):
+                    if repo_name != repository:
+                        continue
+                    
+                    created_timestamp = image.get('Created', 0)
+                    tags.append({
+                        'name': tag,
+                        'tag': tag,
+                        'repository': repository,
+                        'registry_url': f"local://{self.runtime}",
+                        'image_id': image_id_short,
+                        'size': self._format_size(image.get('Size', 0)),
+                        'created': self._format_timestamp(created_timestamp, now),
+                        'created_timestamp': created_timestamp,
+                        # Digest references point at the full repo@sha256:... reference
+                        'digest': ref if digest is not None else f"sha256:{image.get('Id', '')}",
+                        'digest_short': f"sha256:{tag}" if digest is not None else f"sha256:{image_id_short}",
+                        'manifest_media_type': _DOCKER_MANIFEST_MEDIA_TYPE
+                    })
         
         # Sort by creation time (newest first), then by tag name (alphanumeric)
         tags.sort(key=lambda x: (-x.get('created_timestamp', 0), x['name'].lower()))
@@ -543,66 +709,18 @@ class LocalContainerClient:
             }
         
         # Find the image for this repo:tag combination
-        result = await self._run_command(['images', '--format', 'json'])
+        result = await self._list_images()
         if 'error' in result:
             return result
         
-        images = result.get('data', [])
         target_image_id = None
         
-        for image in images:
-            repo_tags = image.get('RepoTags') or []
-            repo_digests = image.get('RepoDigests') or []
-            names = image.get('Names') or []
-            
-            # Combine RepoTags and Names for comprehensive search
-            all_tags = list(repo_tags) if repo_tags else []
-            if names:
-                all_tags.extend(names)
-            # Remove duplicates while preserving order
-            all_tags = list(dict.fromkeys(all_tags))
-            
-            # Check for normal tag match
-            for repo_tag in all_tags:
-                if '@sha256:' not in repo_tag:  # Normal tag
-                    if repo_tag == f"{repository}:{tag}":
-                        target_image_id = image.get('Id', '')
-                        break
-                else:  # Digest reference
-                    if '@' in repo_tag:
-                        repo_name = repo_tag.split('@')[0]
-                        if repo_name == repository:
-                            full_digest_part = repo_tag.split('@')[1]
-                            if full_digest_part.startswith('sha256:'):
-                                digest_short = full_digest_part[7:19]  # First 12 chars of hash
-                            else:
-                                digest_short = full_digest_part[:12]
-                            
-                            if digest_short == tag:  # tag is actually the short digest
-                                target_image_id = image.get('Id', '')
-                                break
-            
-            if target_image_id:
+        # Match repo:tag, or repo + short digest for digest references (including RepoDigests)
+        for image in _images_for_repository(result, repository):
+            if any(repo_name == repository and ref_tag == tag
+                   for repo_name, ref_tag, _, _ in _iter_image_refs(image, include_digests=True)):
+                target_image_id = image.get('Id', '')
                 break
-            
-            # Also check repo_digests for digest-only tags
-            if not target_image_id:
-                for digest in repo_digests:
-                    if '@' in digest:
-                        repo_name = digest.split('@')[0]
-                        if repo_name == repository:
-                            full_digest_part = digest.split('@')[1]
-                            if full_digest_part.startswith('sha256:'):
-                                digest_short = full_digest_part[7:19]
-                            else:
-                                digest_short = full_digest_part[:12]
-                            
-                            if digest_short == tag:
-                                target_image_id = image.get('Id', '')
-                                break
-                
-                if target_image_id:
-                    break
         
         if not target_image_id:
             return {
@@ -611,7 +729,7 @@ class LocalContainerClient:
             }
         
         # Get detailed image information
-        inspect_result = await self._run_command(['inspect', target_image_id])
+        inspect_result = await self._inspect_image(target_image_id)
         if 'error' in inspect_result:
             return inspect_result
         
@@ -625,42 +743,36 @@ class LocalContainerClient:
         image_data = inspect_data[0]
         
         # Extract layer information
-        layers = []
         history = image_data.get('History', [])
         rootfs = image_data.get('RootFS', {})
         layer_digests = rootfs.get('Layers', [])
         
         # Try to estimate layer sizes from history if available
-        history_sizes = []
-        if history:
-            for hist_entry in history:
-                size = hist_entry.get('Size', 0)
-                if size and size > 0:
-                    history_sizes.append(size)
-        
-        for i, layer_digest in enumerate(layer_digests):
-            # Use history size if available, otherwise estimate
-            layer_size = 0
-            if i < len(history_sizes):
-                layer_size = history_sizes[i]
-            elif history_sizes:
-                # Use average of available sizes as estimate
-                layer_size = sum(history_sizes) // len(history_sizes)
-            
-            layer_info = {
-                'mediaType': 'application/vnd.docker.image.rootfs.diff.tar.gzip',
-                'size': layer_size,
+        history_sizes = [size for size in (hist_entry.get('Size', 0) for hist_entry in history)
+                         if size and size > 0]
+        
+        # Use history size if available, otherwise the average of the available sizes as estimate
+        history_count = len(history_sizes)
+        average_size = sum(history_sizes) // history_count if history_count else 0
+        layers = [
+            {
+                'mediaType': _DOCKER_LAYER_MEDIA_TYPE,
+                'size': history_sizes[i] if i < history_count else average_size,
                 'digest': layer_digest
             }
-            layers.append(layer_info)
+            for i, layer_digest in enumerate(layer_digests)
+        ]
+        
+        # Registries store the config blob as compact UTF-8 JSON, so size it that way
+        config_size = len(_json_dumps(image_data.get('Config', {})))
         
         # Create a mock manifest structure
         manifest = {
             'schemaVersion': 2,
-            'mediaType': 'application/vnd.docker.distribution.manifest.v2+json',
+            'mediaType': _DOCKER_MANIFEST_MEDIA_TYPE,
             'config': {
-                'mediaType': 'application/vnd.docker.container.image.v1+json',
-                'size': len(json.dumps(image_data.get('Config', {}))),
+                'mediaType': _DOCKER_CONFIG_MEDIA_TYPE,
+                'size': config_size,
                 'digest': f"sha256:{target_image_id}"
             },
             'layers': layers
@@ -12,8 +12,203 @@ Vibe-Coder: Andrew Potozniak <potozniak@redhat.com>
 Session Date: 2025-08-15
 """
 
-import json
-from typing import Dict, Any
+import hashlib
+import re
+from functools import lru_cache
+from itertools import chain, islice, product
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+
+def _generate_large_repo_list():
+    """Generate a large list of repositories for testing auto-loading"""
+    # Base images
+    base_images = ["ubuntu", "debian", "alpine", "centos", "fedora", "amazonlinux"]
+    base_versions = ["latest", "20.04", "22.04", "18.04", "bullseye", "bookworm", "3.17", "3.18"]
+    # Accumulate into a set so duplicates never pile up; sorted once at the end
+    repos = {f"{base}/{version}" for base, version in product(base_images, base_versions)}
+    
+    # Language runtimes
+    languages = ["node", "python", "golang", "java", "dotnet", "ruby", "php", "rust"]
+    lang_versions = ["latest", "18", "16", "14", "3.11", "3.10", "3.9", "1.20", "1.19", "17", "11", "8"]
+    repos.update(f"{lang}/{version}{suffix}"
+                 for lang, version, suffix in product(languages, lang_versions, ("", "-alpine", "-slim")))
+    
+    # Databases
+    databases = ["mysql", "postgres", "mongodb", "redis", "elasticsearch", "cassandra"]
+    db_versions = ["latest", "8.0", "15", "14", "6.2", "7.0", "8.0"]
+    repos.update(f"{db}/{version}{suffix}"
+                 for db, version, suffix in product(databases, db_versions, ("", "-alpine")))
+    
+    # Web servers
+    web_servers = ["nginx", "apache", "traefik", "caddy"]
+    server_versions = ["latest", "1.25", "1.24", "2.4", "stable", "alpine"]
+    repos.update(f"{server}/{version}" for server, version in product(web_servers, server_versions))
+    
+    # Microservices (lots of these!)
+    services = ["auth-service", "user-service", "order-service", "payment-service", 
+                "notification-service", "catalog-service", "inventory-service",
+                "shipping-service", "analytics-service", "reporting-service"]
+    service_versions = ["v1.0.0", "v1.1.0", "v1.2.0", "v2.0.0", "latest"]
+    repos.update(f"{service}/{env}-{version}"
+                 for service, env, version in product(services, ["prod", "staging", "dev"], service_versions))
+    
+    # DevOps tools
+    tools = ["jenkins", "sonarqube", "nexus", "gitlab", "prometheus", "grafana", "vault"]
+    repos.update(f"{tool}/{version}" for tool, version in product(tools, ["latest", "lts", "latest-alpine"]))
+    
+    return sorted(repos)
+
+
+# Deterministic, so built once at import instead of per MockRegistryData instance
+_MASSIVE_REPOS = _generate_large_repo_list()
+
+# Bulk version tags for the repositories used to test tag auto-loading, also built once
+_NODE_PYTHON_PATCH_TAGS = tuple(f"{major}.{minor}.{patch}"
+                                for major, minor, patch in product(range(16, 21), range(10), range(5)))
+_GOLANG_PATCH_TAGS = tuple(f"1.{minor}.{patch}" for minor, patch in product(range(15, 22), range(10)))
+_SERVICE_BUILD_TAGS = tuple(f"v{major}.{minor}.{patch}{suffix}"
+                            for major, minor, patch, suffix in product(range(1, 4), range(10), range(15),
+                                                                       ("", "-alpha", "-beta")))
+
+
+# Version tags by repository name - (substrings, tags) rules checked in order, the first rule
+# with a substring of the name wins. Lots of tags for some repositories to test auto-loading.
+_VERSION_TAG_RULES = (
+    (("alpine", "ubuntu", "debian"), ("3.18", "3.17", "3.16", "jammy", "focal", "bullseye", "slim")),
+    (("nginx",), ("1.25", "1.24", "1.23", "alpine", "mainline", "stable-alpine")),
+    (("postgres", "mysql"), ("15", "14", "13", "alpine", "15-alpine", "14-alpine")),
+    (("redis",), ("7.2", "7.0", "6.2", "alpine", "7.2-alpine")),
+    (("node", "python"), ("18", "16", "14", "3.11", "3.10", "3.9", "alpine", "slim") + _NODE_PYTHON_PATCH_TAGS),
+    (("golang",), ("1.21", "1.20", "1.19", "alpine", "1.21-alpine") + _GOLANG_PATCH_TAGS),
+    (("microservice", "webapp", "auth-service", "user-service", "order-service", "payment-service",
+      "notification-service", "catalog-service", "inventory-service", "shipping-service",
+      "analytics-service", "reporting-service"),
+     ("v2.1.0", "v2.0.3", "v1.9.8", "dev", "staging", "prod") + _SERVICE_BUILD_TAGS),
+    (("prometheus", "grafana"), ("v2.45.0", "v2.44.0", "main", "latest-ubuntu")),
+)
+_GENERIC_VERSION_TAGS = ("v1.2.3", "v1.2.2", "v1.1.0", "dev", "test")  # Generic service tags
+
+
+# Every rule substring -> index of its rule, and one pattern finding all of them in a single
+# pass (the lookahead reports matches at every position, so overlapping names aren't skipped)
+_VERSION_TAG_RULE_INDEX = {name: index
+                           for index, (substrings, _) in enumerate(_VERSION_TAG_RULES)
+                           for name in substrings}
+_VERSION_TAG_PATTERN = re.compile("(?=(" + "|".join(map(re.escape, _VERSION_TAG_RULE_INDEX)) + "))")
+
+
+@lru_cache(maxsize=4096)
+def _version_tags(repository: str) -> Tuple[str, ...]:
+    """Version tags for a repository; the rule scan runs once per name, later calls are a dict hit"""
+    # Earlier rules win, wherever in the name their substring occurs
+    rule_indexes = [_VERSION_TAG_RULE_INDEX[name] for name in _VERSION_TAG_PATTERN.findall(repository)]
+    if rule_indexes:
+        return _VERSION_TAG_RULES[min(rule_indexes)][1]
+    return _GENERIC_VERSION_TAGS
+
+
+def _stable_hash(text: str) -> str:
+    """64 hex digit BLAKE2b digest of text; unlike hash() it doesn't change with PYTHONHASHSEED"""
+    return hashlib.blake2b(text.encode(), digest_size=32).hexdigest()
+
+
+# Media types used in the manifests built here
+_DOCKER_MANIFEST_MEDIA_TYPE = "application/vnd.docker.distribution.manifest.v2+json"
+_DOCKER_CONFIG_MEDIA_TYPE = "application/vnd.docker.container.image.v1+json"
+_DOCKER_LAYER_MEDIA_TYPE = "application/vnd.docker.image.rootfs.diff.tar.gzip"
+_OCI_MANIFEST_MEDIA_TYPE = "application/vnd.oci.image.manifest.v1+json"
+_OCI_CONFIG_MEDIA_TYPE = "application/vnd.oci.image.config.v1+json"
+
+
+def _layer_sizes(layer_count: int, base_size: int) -> Tuple[int, ...]:
+    """Realistic layer hierarchy for a mock image
+    
+    The base layer is typically largest, middle layers vary and the app layer is typically smallest.
+    """
+    sizes = [base_size] + [base_size // (2 + i) for i in range(1, layer_count - 1)]
+    if layer_count > 1:
+        sizes.append(base_size // 10)
+    return tuple(sizes)
+
+
+# Mock manifest layer sizes by image type, computed once
+_SMALL_BASE_LAYER_SIZES = _layer_sizes(1, 2500000)  # Smaller base images
+_LARGE_BASE_LAYER_SIZES = _layer_sizes(4, 28000000)  # Larger base images
+_RUNTIME_LAYER_SIZES = _layer_sizes(6, 45000000)  # Runtime images
+_APPLICATION_LAYER_SIZES = _layer_sizes(8, 12000000)  # Application images (by substring)
+_DEFAULT_LAYER_SIZES = _layer_sizes(3, 5432100)
+_LAYER_SIZES_BY_REPOSITORY = {
+    "alpine": _SMALL_BASE_LAYER_SIZES, "distroless/base": _SMALL_BASE_LAYER_SIZES,
+    "ubuntu": _LARGE_BASE_LAYER_SIZES, "debian": _LARGE_BASE_LAYER_SIZES,
+    "node": _RUNTIME_LAYER_SIZES, "python": _RUNTIME_LAYER_SIZES, "golang": _RUNTIME_LAYER_SIZES,
+}
+
+
+@lru_cache(maxsize=4096)
+def _build_manifest(registry_url: str, repository: str, tag: str) -> Dict[str, Any]:
+    """Build the mock manifest response; cached, so the returned dict is shared and read-only"""
+    # Generate realistic layer sizes and counts based on image type
+    layer_sizes = _LAYER_SIZES_BY_REPOSITORY.get(repository)
+    if layer_sizes is None:
+        if "microservice" in repository or "webapp" in repository:
+            layer_sizes = _APPLICATION_LAYER_SIZES
+        else:
+            layer_sizes = _DEFAULT_LAYER_SIZES
+    
+    # Digests are BLAKE2b of "repository:tag:<part>", so they are stable across runs and look
+    # like real 64-hex sha256 values; each part extends a copy of the shared prefix state
+    digest_base = hashlib.blake2b(f"{repository}:{tag}:".encode(), digest_size=32)
+    
+    def part_digest(part: bytes) -> str:
+        part_hash = digest_base.copy()
+        part_hash.update(part)
+        return f"sha256:{part_hash.hexdigest()}"
+    
+    layers = [
+        {
+            "mediaType": _DOCKER_LAYER_MEDIA_TYPE,
+            "size": size,
+            "digest": part_digest(b"layer%d" % i)
+        }
+        for i, size in enumerate(layer_sizes)
+    ]
+    
+    # Use OCI manifest format for some registries to test compatibility
+    if "gcr-io" in registry_url or "quay-io" in registry_url:
+        media_type = _OCI_MANIFEST_MEDIA_TYPE
+        config_media_type = _OCI_CONFIG_MEDIA_TYPE
+    else:
+        media_type = _DOCKER_MANIFEST_MEDIA_TYPE
+        config_media_type = _DOCKER_CONFIG_MEDIA_TYPE
+    
+    manifest_digest = part_digest(b"manifest")
+    config_digest = part_digest(b"config")
+    
+    return {
+        "status_code": 200,
+        "json": {
+            "schemaVersion": 2,
+            "mediaType": media_type,
+            "config": {
+                "mediaType": config_media_type,
+                "size": 1234 + int(_stable_hash(repository)[:8], 16) % 5000,  # Vary config size
+                "digest": config_digest
+            },
+            "layers": layers
+        },
+        "headers": {
+            "Content-Type": media_type,
+            "Docker-Content-Digest": manifest_digest
+        }
+    }
+
+
+_API_VERSION_RESPONSE = {
+    "status_code": 200,
+    "json": {"version": "v2"},
+    "headers": {"Docker-Distribution-API-Version": "registry/2.0"}
+}
 
 
 class MockRegistryData:
@@ -66,126 +261,59 @@ class MockRegistryData:
                 "url": "mock://massive-registry", 
                 "api_version": "v2",
                 "status": "healthy",
-                "repositories": self._generate_large_repo_list(),
+                "repositories": _MASSIVE_REPOS,
                 "auth_required": False
             }
         }
-    
-    def _generate_large_repo_list(self):
-        """Generate a large list of repositories for testing auto-loading"""
-        repos = []
-        
-        # Base images
-        base_images = ["ubuntu", "debian", "alpine", "centos", "fedora", "amazonlinux"]
-        for base in base_images:
-            for version in ["latest", "20.04", "22.04", "18.04", "bullseye", "bookworm", "3.17", "3.18"]:
-                repos.append(f"{base}/{version}")
-        
-        # Language runtimes
-        languages = ["node", "python", "golang", "java", "dotnet", "ruby", "php", "rust"]
-        for lang in languages:
-            for version in ["latest", "18", "16", "14", "3.11", "3.10", "3.9", "1.20", "1.19", "17", "11", "8"]:
-                repos.append(f"{lang}/{version}")
-                repos.append(f"{lang}/{version}-alpine")
-                repos.append(f"{lang}/{version}-slim")
-        
-        # Databases
-        databases = ["mysql", "postgres", "mongodb", "redis", "elasticsearch", "cassandra"]
-        for db in databases:
-            for version in ["latest", "8.0", "15", "14", "6.2", "7.0", "8.0"]:
-                repos.append(f"{db}/{version}")
-                repos.append(f"{db}/{version}-alpine")
-        
-        # Web servers
-        web_servers = ["nginx", "apache", "traefik", "caddy"]
-        for server in web_servers:
-            for version in ["latest", "1.25", "1.24", "2.4", "stable", "alpine"]:
-                repos.append(f"{server}/{version}")
-        
-        # Microservices (lots of these!)
-        services = ["auth-service", "user-service", "order-service", "payment-service", 
-                   "notification-service", "catalog-service", "inventory-service",
-                   "shipping-service", "analytics-service", "reporting-service"]
-        for service in services:
-            for env in ["prod", "staging", "dev"]:
-                for version in ["v1.0.0", "v1.1.0", "v1.2.0", "v2.0.0", "latest"]:
-                    repos.append(f"{service}/{env}-{version}")
         
-        # DevOps tools
-        tools = ["jenkins", "sonarqube", "nexus", "gitlab", "prometheus", "grafana", "vault"]
-        for tool in tools:
-            for version in ["latest", "lts", "latest-alpine"]:
-                repos.append(f"{tool}/{version}")
-        
-        return sorted(list(set(repos)))  # Remove duplicates and sort
-    
-    def get_api_version(self, registry_url: str) -> Dict[str, Any]:
-        """Mock response for GET /v2/"""
-        if registry_url in self.registries:
-            return {
-                "status_code": 200,
-                "json": {"version": "v2"},
-                "headers": {"Docker-Distribution-API-Version": "registry/2.0"}
-            }
-        return {"status_code": 404, "json": {"error": "registry not found"}}
-    
-    def get_catalog(self, registry_url: str) -> Dict[str, Any]:
-        """Mock response for GET /v2/_catalog"""
-        if registry_url in self.registries:
-            registry = self.registries[registry_url]
-            return {
+        # Catalog and info responses only wrap constant data, so build each registry's once
+        self._catalog_responses = {
+            url: {
                 "status_code": 200,
                 "json": {
                     "repositories": registry["repositories"]
                 },
                 "headers": {"Content-Type": "application/json"}
             }
+            for url, registry in self.registries.items()
+        }
+        self._registry_infos = {
+            url: {
+                "name": registry["name"],
+                "url": registry["url"],
+                "api_version": registry["api_version"],
+                "status": "✅" if registry["status"] == "healthy" else "❌",
+                "auth_required": registry["auth_required"],
+                "repository_count": len(registry["repositories"]),
+                "last_checked": "Mock Time",
+                "response_time": "1ms",
+                "ssl_status": "Mock SSL"
+            }
+            for url, registry in self.registries.items()
+        }
+    
+    def get_api_version(self, registry_url: str) -> Dict[str, Any]:
+        """Mock response for GET /v2/ (shared between calls; treat as read-only)"""
+        if registry_url in self.registries:
+            return _API_VERSION_RESPONSE
+        return {"status_code": 404, "json": {"error": "registry not found"}}
+    
+    def get_catalog(self, registry_url: str) -> Dict[str, Any]:
+        """Mock response for GET /v2/_catalog (shared between calls; treat as read-only)"""
+        response = self._catalog_responses.get(registry_url)
+        if response is not None:
+            return response
         return {"status_code": 404, "json": {"error": "registry not found"}}
     
-    def get_tags(self, registry_url: str, repository: str) -> Dict[str, Any]:
-        """Mock response for GET /v2/{name}/tags/list"""
+    def iter_tags(self, repository: str) -> Iterator[str]:
+        """Lazily yield a repository's mock tags, for callers that only need the first few"""
+        # Generate mock tags based on repository name with realistic variety
+        return chain(("latest", "stable"), _version_tags(repository))
+    
+    def get_tags(self, registry_url: str, repository: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Mock response for GET /v2/{name}/tags/list (limit mirrors the API's ?n= page size)"""
         if registry_url in self.registries:
-            # Generate mock tags based on repository name with realistic variety
-            base_tags = ["latest", "stable"]
-            
-            # Version tags - create lots for some repositories to test auto-loading
-            if any(name in repository for name in ["alpine", "ubuntu", "debian"]):
-                base_tags.extend(["3.18", "3.17", "3.16", "jammy", "focal", "bullseye", "slim"])
-            elif "nginx" in repository:
-                base_tags.extend(["1.25", "1.24", "1.23", "alpine", "mainline", "stable-alpine"])
-            elif any(name in repository for name in ["postgres", "mysql"]):
-                base_tags.extend(["15", "14", "13", "alpine", "15-alpine", "14-alpine"])
-            elif "redis" in repository:
-                base_tags.extend(["7.2", "7.0", "6.2", "alpine", "7.2-alpine"])
-            elif any(name in repository for name in ["node", "python"]):
-                # Add lots of version tags for testing auto-loading
-                base_tags.extend(["18", "16", "14", "3.11", "3.10", "3.9", "alpine", "slim"])
-                # Add many patch versions
-                for major in [16, 17, 18, 19, 20]:
-                    for minor in range(10):
-                        for patch in range(5):
-                            base_tags.append(f"{major}.{minor}.{patch}")
-            elif "golang" in repository:
-                base_tags.extend(["1.21", "1.20", "1.19", "alpine", "1.21-alpine"])
-                # Add many Go versions for testing
-                for major in [1]:
-                    for minor in range(15, 22):
-                        for patch in range(10):
-                            base_tags.append(f"{major}.{minor}.{patch}")
-            elif any(service in repository for service in ["microservice", "webapp", "auth-service", "user-service", "order-service", "payment-service", "notification-service", "catalog-service", "inventory-service", "shipping-service", "analytics-service", "reporting-service"]):
-                base_tags.extend(["v2.1.0", "v2.0.3", "v1.9.8", "dev", "staging", "prod"])
-                # Add many build versions for testing
-                for major in range(1, 4):
-                    for minor in range(10):
-                        for patch in range(15):
-                            base_tags.append(f"v{major}.{minor}.{patch}")
-                            base_tags.append(f"v{major}.{minor}.{patch}-alpha")
-                            base_tags.append(f"v{major}.{minor}.{patch}-beta")
-            elif "prometheus" in repository or "grafana" in repository:
-                base_tags.extend(["v2.45.0", "v2.44.0", "main", "latest-ubuntu"])
-            else:
-                # Generic service tags
-                base_tags.extend(["v1.2.3", "v1.2.2", "v1.1.0", "dev", "test"])
+            base_tags = list(islice(self.iter_tags(repository), limit))
             
             return {
                 "status_code": 200,
@@ -200,92 +328,19 @@ class MockRegistryData:
     def get_manifest(self, registry_url: str, repository: str, tag: str) -> Dict[str, Any]:
         """Mock response for GET /v2/{name}/manifests/{tag}"""
         if registry_url in self.registries:
-            # Generate realistic layer sizes and counts based on image type
-            layer_count = 3  # Default
-            base_size = 5432100  # Default base layer size
-            
-            if repository in ["alpine", "distroless/base"]:
-                layer_count = 1
-                base_size = 2500000  # Smaller base images
-            elif repository in ["ubuntu", "debian"]:
-                layer_count = 4
-                base_size = 28000000  # Larger base images
-            elif repository in ["node", "python", "golang"]:
-                layer_count = 6
-                base_size = 45000000  # Runtime images
-            elif "microservice" in repository or "webapp" in repository:
-                layer_count = 8
-                base_size = 12000000  # Application images
-            
-            # Generate realistic layer hierarchy
-            layers = []
-            for i in range(layer_count):
-                if i == 0:  # Base layer is typically largest
-                    size = base_size
-                elif i == layer_count - 1:  # App layer is typically smallest
-                    size = base_size // 10
-                else:  # Middle layers vary
-                    size = base_size // (2 + i)
-                
-                layers.append({
-                    "mediaType": "application/vnd.docker.image.rootfs.diff.tar.gzip",
-                    "size": size,
-                    "digest": f"sha256:{hash(f'{repository}:{tag}:layer{i}'):064x}"[:64]
-                })
-            
-            # Use OCI manifest format for some registries to test compatibility
-            if "gcr-io" in registry_url or "quay-io" in registry_url:
-                media_type = "application/vnd.oci.image.manifest.v1+json"
-                config_media_type = "application/vnd.oci.image.config.v1+json"
-            else:
-                media_type = "application/vnd.docker.distribution.manifest.v2+json"
-                config_media_type = "application/vnd.docker.container.image.v1+json"
-            
-            manifest_digest = f"sha256:{hash(f'{repository}:{tag}:manifest'):064x}"[:64]
-            config_digest = f"sha256:{hash(f'{repository}:{tag}:config'):064x}"[:64]
-            
-            return {
-                "status_code": 200,
-                "json": {
-                    "schemaVersion": 2,
-                    "mediaType": media_type,
-                    "config": {
-                        "mediaType": config_media_type,
-                        "size": 1234 + hash(repository) % 5000,  # Vary config size
-                        "digest": config_digest
-                    },
-                    "layers": layers
-                },
-                "headers": {
-                    "Content-Type": media_type,
-                    "Docker-Content-Digest": manifest_digest
-                }
-            }
+            return _build_manifest(registry_url, repository, tag)
         return {"status_code": 404, "json": {"error": "manifest not found"}}
     
     def get_registry_info(self, registry_url: str) -> Dict[str, Any]:
-        """Get mock registry information for display"""
-        if registry_url in self.registries:
-            registry = self.registries[registry_url]
-            return {
-                "name": registry["name"],
-                "url": registry["url"],
-                "api_version": registry["api_version"],
-                "status": "✅" if registry["status"] == "healthy" else "❌",
-                "auth_required": registry["auth_required"],
-                "repository_count": len(registry["repositories"]),
-                "last_checked": "Mock Time",
-                "response_time": "1ms",
-                "ssl_status": "Mock SSL"
-            }
-        return None
+        """Get mock registry information for display (shared between calls; treat as read-only)"""
+        return self._registry_infos.get(registry_url)
 
 
 class MockDebugData:
     """Mock debug/API call data for testing the debug console"""
     
     def __init__(self):
-        self.mock_api_calls = []
+        self.mock_api_calls = ()
         self._generate_mock_calls()
     
     def _generate_mock_calls(self):
@@ -294,10 +349,14 @@ class MockDebugData:
         
         base_time = time.time() - 300  # 5 minutes ago
         
+        def timestamp(offset: int) -> str:
+            """HH:MM:SS of the mock call made `offset` seconds after base_time"""
+            return time.strftime("%H:%M:%S", time.localtime(base_time + offset))
+        
         # Mock API calls with realistic patterns
         calls = [
             {
-                "timestamp": time.strftime("%H:%M:%S", time.localtime(base_time)),
+                "timestamp": timestamp(0),
                 "method": "GET",
                 "url": "mock://public-registry/v2/",
                 "status_code": 200,
@@ -308,7 +367,7 @@ class MockDebugData:
                 "headers": {"Docker-Distribution-API-Version": "registry/2.0"}
             },
             {
-                "timestamp": time.strftime("%H:%M:%S", time.localtime(base_time + 10)),
+                "timestamp": timestamp(10),
                 "method": "GET", 
                 "url": "mock://public-registry/v2/_catalog",
                 "status_code": 200,
@@ -319,7 +378,7 @@ class MockDebugData:
                 "headers": {"Content-Type": "application/json"}
             },
             {
-                "timestamp": time.strftime("%H:%M:%S", time.localtime(base_time + 25)),
+                "timestamp": timestamp(25),
                 "method": "GET",
                 "url": "mock://public-registry/v2/alpine/tags/list",
                 "status_code": 200,
@@ -330,7 +389,7 @@ class MockDebugData:
                 "headers": {"Content-Type": "application/json"}
             },
             {
-                "timestamp": time.strftime("%H:%M:%S", time.localtime(base_time + 45)),
+                "timestamp": timestamp(45),
                 "method": "GET",
                 "url": "mock://quay-io/v2/prometheus/prometheus/manifests/latest",
                 "status_code": 200,
@@ -341,7 +400,7 @@ class MockDebugData:
                 "headers": {"Content-Type": "application/vnd.docker.distribution.manifest.v2+json"}
             },
             {
-                "timestamp": time.strftime("%H:%M:%S", time.localtime(base_time + 60)),
+                "timestamp": timestamp(60),
                 "method": "GET",
                 "url": "mock://enterprise/v2/microservice-a/tags/list",
                 "status_code": 404,
@@ -353,7 +412,7 @@ class MockDebugData:
                 "error": "Repository not found"
             },
             {
-                "timestamp": time.strftime("%H:%M:%S", time.localtime(base_time + 80)),
+                "timestamp": timestamp(80),
                 "method": "GET",
                 "url": "mock://gcr-io/v2/distroless/base/manifests/latest",
                 "status_code": 200,
@@ -365,11 +424,12 @@ class MockDebugData:
             }
         ]
         
-        self.mock_api_calls = calls
+        # Frozen: the same call mappings are re-seeded into the API log after every purge
+        self.mock_api_calls = tuple(MappingProxyType(call) for call in calls)
     
     def get_mock_calls(self):
-        """Get all mock API calls"""
-        return self.mock_api_calls.copy()
+        """Get all mock API calls (read-only mappings built once, so no copy is needed)"""
+        return self.mock_api_calls
 
 
 # Global mock data instances
@@ -13,11 +13,54 @@ Session Date: 2025-08-15
 """
 
 import asyncio
+import json
+import re
+import ssl
 import time
 import base64
-from typing import Dict, List, Any, Optional
+import hashlib
+from collections import deque
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+import certifi
 import httpx
-from urllib.parse import urljoin
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse
+
+try:
+    # Optional: parses the raw body bytes several times faster than the json module
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional: lets httpx multiplex concurrent tag/manifest requests over one connection
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# key="value" parameters of a WWW-Authenticate challenge, and <url>; rel="..." entries of a Link header
+_WWW_AUTH_PARAM_RE = re.compile(r'(\w+)="([^"]*)"')
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+
+# Connection pool for a registry session; sized above RegistryManager.TAGS_FETCH_CONCURRENCY
+_SESSION_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30)
+
+
+@lru_cache(maxsize=None)
+def _verified_ssl_context() -> ssl.SSLContext:
+    """TLS context shared by all registry sessions
+    
+    Loading the CA bundle is the slow part of creating a verifying client, so it is
+    done once instead of per session.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _active_debug_logger(debug_logger):
+    """Return the debug logger only if it will actually write, so callers' guards skip building log context"""
+    return debug_logger if debug_logger and getattr(debug_logger, "enabled", True) else None
 
 
 def sort_tags_by_timestamp(tags_list, manifest_metadata=None):
@@ -28,75 +71,138 @@ def sort_tags_by_timestamp(tags_list, manifest_metadata=None):
     
     # Build tag-to-timestamp mapping
     tag_timestamps = {}
-    for manifest_sha, manifest_data in manifest_metadata.items():
-        tags_for_manifest = manifest_data.get("tag", [])
+    for manifest_data in manifest_metadata.values():
         time_uploaded = manifest_data.get("timeUploadedMs", "0")
         time_created = manifest_data.get("timeCreatedMs", "0")
         
         # Use upload time if available, otherwise creation time
-        timestamp = int(time_uploaded) if time_uploaded != "0" else int(time_created)
+        timestamp = int(time_uploaded) if time_uploaded and time_uploaded != "0" else int(time_created or 0)
         
-        for tag in tags_for_manifest:
-            tag_timestamps[tag] = timestamp
+        tag_timestamps.update(dict.fromkeys(manifest_data.get("tag", []), timestamp))
     
-    # Sort by timestamp (newest first), then alphabetically
-    def tag_sort_key(tag_name):
-        timestamp = tag_timestamps.get(tag_name, 0)
-        return (-timestamp, tag_name.lower())
+    # Sort by timestamp (newest first), then alphabetically; the index keeps
+    # the sort stable for names that only differ in case
+    decorated = [
+        (-tag_timestamps.get(tag_name, 0), tag_name.lower(), index, tag_name)
+        for index, tag_name in enumerate(tags_list)
+    ]
+    decorated.sort()
+    return [tag_name for _, _, _, tag_name in decorated]
+
+
+def format_call_size(size_bytes: int) -> str:
+    """Format a logged API call's response size for the debug console list"""
+    if size_bytes > 1024:
+        return f"{size_bytes / 1024:.1f}KB"
+    return f"{size_bytes}B"
+
+
+def call_response_text(call_data: Dict[str, Any], limit: Optional[int] = None) -> str:
+    """Response body of a logged API call as text, optionally only its first `limit` bytes
     
-    return sorted(tags_list, key=tag_sort_key)
+    HTTP calls keep the raw body bytes and are only decoded here, when the debug
+    console actually shows them; other records carry 'response_content_full' text.
+    """
+    body = call_data.get("response_body")
+    if body is None:
+        text = call_data.get("response_content_full") or ""
+        return text if limit is None else text[:limit]
+    if limit is not None:
+        body = body[:limit]
+    return body.decode("utf-8", errors="replace")
+
+
+# (whole second, "HH:MM:SS." prefix) of the last timestamp formatted by call_timestamp
+_last_timestamp_second = [None, '']
+
+def call_timestamp() -> str:
+    """Current local time as HH:MM:SS.mmm for the API call log
+    
+    Reads the clock once, and only re-runs strftime when the second changes.
+    """
+    now = time.time()
+    second = int(now)
+    if second != _last_timestamp_second[0]:
+        _last_timestamp_second[:] = [second, time.strftime("%H:%M:%S.", time.localtime(second))]
+    return _last_timestamp_second[1] + f"{int((now - second) * 1000):03d}"
+
+
+# Accept header for manifest requests - every manifest format the tag views can display
+_MANIFEST_ACCEPT = ", ".join([
+    "application/vnd.docker.distribution.manifest.v2+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json", 
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.v1+json"
+])
 
 
 class RegistryClient:
     """HTTP client for Docker Registry API v2 with authentication support"""
     
-    def __init__(self, base_url: str, timeout: int = 30, username: str = None, password: str = None, auth_type: str = "bearer", auth_scope: str = "registry:catalog:*", tui_debug_logger=None):
+    # The /v2/ probe is cheap, so an unresponsive registry is reported quickly
+    API_VERSION_TIMEOUT = 5
+    
+    # TLS certificates are verified unless started with --insecure (self-signed/test registries)
+    verify_tls = True
+    
+    # Response headers safe to keep in debug logs
+    SAFE_RESPONSE_HEADERS = frozenset({
+        'content-type', 'content-length', 'content-encoding',
+        'date', 'cache-control', 'expires', 'last-modified', 'etag',  # Validators for conditional requests
+        'link', 'location',  # Important for pagination
+        'docker-content-digest', 'docker-distribution-api-version',
+        'x-ratelimit-limit', 'x-ratelimit-remaining', 'x-ratelimit-reset',  # Rate limiting info
+        'www-authenticate',  # Auth challenge info (public by design)
+        'access-control-allow-origin', 'access-control-allow-methods',  # CORS
+        'strict-transport-security', 'x-content-type-options',  # Security headers (safe to log)
+    })
+    
+    def __init__(self, base_url: str, timeout: int = 30, username: str = None, password: str = None, auth_type: str = "bearer", auth_scope: str = "registry:catalog:*", tui_debug_logger=None, session: httpx.AsyncClient = None):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = None
+        self.session = session
+        self._owns_session = session is None  # An injected (pooled) session outlives this client
         self.username = username
         self.password = password
         self.auth_type = auth_type  # "bearer", "basic", or "none"
         self.auth_scope = auth_scope  # Default scope for token requests
-        self.tui_debug_logger = tui_debug_logger  # For file-based auth/cache debug logging
+        self.tui_debug_logger = _active_debug_logger(tui_debug_logger)  # For file-based auth/cache debug logging
         # Token authentication cache
         self.cached_token = None
+        self.token_issued_at = None
         self.token_expires_at = None
         self.token_scope = None
         self.auth_service = None
         self.auth_realm = None
+        self._token_refresh_task: Optional[asyncio.Task] = None  # Proactive refresh in flight
+        self._token_requests: Dict[str, asyncio.Task] = {}  # Scope -> token request in flight
+        # Last built auth headers and the (auth type, username, password, token) they were built from
+        self._auth_header_cache: Dict[str, str] = {}
+        self._auth_header_key: Optional[Tuple] = None
     
-    def _filter_response_headers(self, headers: dict) -> dict:
+    def _filter_response_headers(self, headers: Mapping[str, str]) -> Dict[str, str]:
         """Filter response headers to exclude potentially sensitive information
         
         Excludes: Set-Cookie, Authorization, custom X- headers with auth/token/key/secret
         Includes: Content headers, Link (pagination), Docker headers, rate limiting, WWW-Authenticate
-        """
-        # Safe headers to include in debug logs
-        safe_headers = {
-            'content-type', 'content-length', 'content-encoding',
-            'date', 'cache-control', 'expires', 'last-modified',
-            'link', 'location',  # Important for pagination
-            'docker-content-digest', 'docker-distribution-api-version',
-            'x-ratelimit-limit', 'x-ratelimit-remaining', 'x-ratelimit-reset',  # Rate limiting info
-            'www-authenticate',  # Auth challenge info (public by design)
-            'access-control-allow-origin', 'access-control-allow-methods',  # CORS
-            'strict-transport-security', 'x-content-type-options',  # Security headers (safe to log)
-        }
         
+        Takes the response's httpx.Headers directly; only the kept headers are copied.
+        """
         # Filter headers case-insensitively
         filtered = {}
         sensitive_headers_found = []
         
         for key, value in headers.items():
-            if key.lower() in safe_headers:
+            name = key.lower()
+            if name in self.SAFE_RESPONSE_HEADERS:
                 filtered[key] = value
-            elif key.lower().startswith('x-') and not any(sensitive in key.lower() for sensitive in ['auth', 'token', 'key', 'secret']):
+            elif name.startswith('x-') and not any(sensitive in name for sensitive in ('auth', 'token', 'key', 'secret')):
                 # Include custom headers unless they look auth-related
                 filtered[key] = value
-            else:
+            elif self.tui_debug_logger:
                 # Track filtered headers for debugging
-                sensitive_headers_found.append(key.lower())
+                sensitive_headers_found.append(name)
         
         # Log if we filtered any headers (for debugging the filtering itself)
         if sensitive_headers_found and self.tui_debug_logger:
@@ -107,22 +213,45 @@ class RegistryClient:
         
         return filtered
     
-    async def __aenter__(self):
-        """Async context manager entry"""
-        self.session = httpx.AsyncClient(
-            timeout=self.timeout,
-            verify=False,  # TODO: Make SSL verification configurable
+    @classmethod
+    def create_session(cls, timeout: int = 30, http2: bool = True) -> httpx.AsyncClient:
+        """Create the HTTP session used for registry requests
+        
+        HTTP/2 is only offered when h2 is installed; registries that don't speak it
+        fall back to HTTP/1.1 during the TLS handshake.
+        """
+        return httpx.AsyncClient(
+            timeout=timeout,
+            http2=http2 and _HTTP2_AVAILABLE,
+            limits=_SESSION_LIMITS,
+            verify=_verified_ssl_context() if cls.verify_tls else False,
             follow_redirects=True,
             headers={
                 "User-Agent": "Container-Card-Catalog/0.1.0 (https://github.com/anthropics/claude-code)"
             }
         )
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        if self._owns_session:
+            self.session = self.create_session(self.timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.aclose()
+        # The refresh task only awaits a shielded token request, so cancel the requests themselves
+        # too and let them unwind before the session they post on is closed
+        pending = [task for task in (self._token_refresh_task, *self._token_requests.values())
+                   if task and not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._owns_session:
+            # Drop the closed session so nothing keeps using it past the context
+            session, self.session = self.session, None
+            if session is not None:
+                await session.aclose()
     
     def _get_basic_auth_header(self) -> Dict[str, str]:
         """Generate basic auth header"""
@@ -146,18 +275,17 @@ class RegistryClient:
         return {}
     
     def _get_auth_headers(self) -> Dict[str, str]:
-        """Get appropriate authentication headers"""
+        """Get appropriate authentication headers
+        
+        The returned dict is shared between requests and must not be modified.
+        """
         if self.tui_debug_logger:
             self.tui_debug_logger.debug("Getting auth headers", 
                                       auth_type=self.auth_type,
                                       has_username=bool(self.username),
                                       has_cached_token=bool(self.cached_token))
         
-        if self.auth_type == "basic":
-            return self._get_basic_auth_header()
-        elif self.auth_type == "bearer":
-            return self._get_bearer_auth_header()
-        elif self.auth_type == "token" and self.cached_token:
+        if self.auth_type == "token" and self.cached_token:
             # Check if token is expired
             if self.token_expires_at and time.time() >= self.token_expires_at:
                 if self.tui_debug_logger:
@@ -166,15 +294,52 @@ class RegistryClient:
                 self.cached_token = None  # Clear expired token
                 return {}
             
+            # Still valid but close to expiry: refresh in the background and keep using this one,
+            # so requests don't race the expiry into a 401 -> token -> retry round trip. Token state
+            # lives on this client, so this only helps within one long-running call (e.g. a paginated listing)
+            if self._token_refresh_due() and not (self._token_refresh_task and not self._token_refresh_task.done()):
+                if self.tui_debug_logger:
+                    self.tui_debug_logger.debug("Token nearing expiry - refreshing in background",
+                                              expires_in_seconds=int(self.token_expires_at - time.time()))
+                self._token_refresh_task = asyncio.get_running_loop().create_task(
+                    self._get_registry_token(self.token_scope))
+            
             # Token is valid, log cache hit
             if self.tui_debug_logger:
                 time_until_expiry = self.token_expires_at - time.time() if self.token_expires_at else None
                 self.tui_debug_logger.debug("Token cache hit", 
                                           expires_in_seconds=int(time_until_expiry) if time_until_expiry else "unknown",
                                           token_scope=self.token_scope)
+        
+        # Headers only change with the credentials or token, so build (and base64-encode) them once per change
+        key = (self.auth_type, self.username, self.password, self.cached_token)
+        if key != self._auth_header_key:
+            self._auth_header_cache = self._build_auth_headers()
+            self._auth_header_key = key
+        return self._auth_header_cache
+    
+    def _build_auth_headers(self) -> Dict[str, str]:
+        """Build the authentication headers for the current auth type"""
+        if self.auth_type == "basic":
+            return self._get_basic_auth_header()
+        elif self.auth_type == "bearer":
+            return self._get_bearer_auth_header()
+        elif self.auth_type == "token" and self.cached_token:
             return {"Authorization": f"Bearer {self.cached_token}"}
         return {}  # No auth
     
+    def _token_refresh_due(self) -> bool:
+        """Whether the cached token is inside its refresh window
+        
+        The window is the last 10% of the token's lifetime, at least 60s, but never more
+        than half of it so short-lived tokens aren't refreshed on every request.
+        """
+        if not self.token_expires_at or not self.token_issued_at:
+            return False
+        lifetime = self.token_expires_at - self.token_issued_at
+        window = min(max(60, lifetime * 0.1), lifetime / 2)
+        return time.time() >= self.token_expires_at - window
+    
     async def _parse_www_authenticate(self, www_auth_header: str) -> Dict[str, str]:
         """Parse WWW-Authenticate header to extract realm, service, scope"""
         auth_params = {}
@@ -186,10 +351,7 @@ class RegistryClient:
         
         if 'Bearer' in www_auth_header:
             # Extract parameters from: Bearer realm="...",service="...",scope="..."
-            import re
-            pattern = r'(\w+)="([^"]*)"'
-            matches = re.findall(pattern, www_auth_header)
-            auth_params = dict(matches)
+            auth_params = dict(_WWW_AUTH_PARAM_RE.findall(www_auth_header))
             
             # Log parsed parameters (realm is safe to log)
             if self.tui_debug_logger:
@@ -201,13 +363,27 @@ class RegistryClient:
         return auth_params
     
     async def _get_registry_token(self, scope: str = None) -> Optional[str]:
-        """Get authentication token from registry auth service"""
-        if not self.username or not self.password:
-            return None
+        """Get authentication token from registry auth service
         
+        Concurrent callers (e.g. several requests hitting 401 at once) share one token
+        request per scope instead of each posting to the auth service.
+        """
         # Use provided scope or default to configured scope
         if scope is None:
             scope = self.auth_scope
+        
+        token_request = self._token_requests.get(scope)
+        if token_request is None:
+            token_request = asyncio.get_running_loop().create_task(self._request_registry_token(scope))
+            self._token_requests[scope] = token_request
+            token_request.add_done_callback(lambda _: self._token_requests.pop(scope, None))
+        # Shielded so a cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(token_request)
+    
+    async def _request_registry_token(self, scope: str) -> Optional[str]:
+        """Request a token for `scope` from the registry auth service"""
+        if not self.username or not self.password:
+            return None
             
         # First, try to get auth challenge if we don't have realm/service
         if not self.auth_realm or not self.auth_service:
@@ -254,16 +430,14 @@ class RegistryClient:
             )
             
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = _json_loads(response.content)
                 token = token_data.get('token') or token_data.get('access_token')
                 if token:
                     self.cached_token = token
                     self.token_scope = scope
+                    self.token_issued_at = time.time()
                     
                     # Handle token expiration
-                    import time
-                    from datetime import datetime, timedelta
-                    
                     expires_in = token_data.get('expires_in')  # seconds from now
                     issued_at = token_data.get('issued_at')    # ISO timestamp
                     
@@ -298,16 +472,23 @@ class RegistryClient:
         return None
     
     
-    async def _make_request(self, endpoint: str) -> Dict[str, Any]:
-        """Make HTTP request and return response data"""
-        url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
-        start_time = time.time()
+    async def _make_request(self, endpoint: str, headers: Optional[Dict[str, str]] = None,
+                            timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Make HTTP request and return response data (timeout overrides the session's)"""
+        if endpoint.startswith('/'):
+            url = self.base_url + endpoint  # base_url has no trailing slash, so this is the join
+        else:
+            url = urljoin(self.base_url + '/', endpoint)  # Relative or absolute (e.g. a followed link)
+        start_ns = time.perf_counter_ns()  # Monotonic, so durations survive wall-clock adjustments
         
         # Get authentication headers if configured
-        auth_headers = self._get_auth_headers()
+        request_headers = dict(headers) if headers else {}
+        request_headers.update(self._get_auth_headers())
+        
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
         
         try:
-            response = await self.session.get(url, headers=auth_headers)
+            response = await self.session.get(url, headers=request_headers, timeout=request_timeout)
             
             # If we get 401 and have credentials, try token auth
             if response.status_code == 401:
@@ -326,8 +507,8 @@ class RegistryClient:
                     if token:
                         if self.tui_debug_logger:
                             self.tui_debug_logger.debug("Token acquired, retrying request")
-                        auth_headers = {"Authorization": f"Bearer {token}"}
-                        response = await self.session.get(url, headers=auth_headers)
+                        request_headers["Authorization"] = f"Bearer {token}"
+                        response = await self.session.get(url, headers=request_headers, timeout=request_timeout)
                     else:
                         if self.tui_debug_logger:
                             self.tui_debug_logger.debug("Token acquisition failed")
@@ -335,42 +516,41 @@ class RegistryClient:
                     if self.tui_debug_logger:
                         self.tui_debug_logger.debug("No credentials for token auth - continuing with 401")
             
-            duration = int((time.time() - start_time) * 1000)  # ms
+            duration = (time.perf_counter_ns() - start_ns) // 1_000_000  # ms
             
             
-            # Prepare response data
+            # Prepare response data; the body stays bytes until the debug console decodes it
+            body = response.content
             response_data = {
                 "url": url,
                 "method": response.request.method,
                 "status_code": response.status_code,
                 "duration_ms": duration,
-                "size_bytes": len(response.content),
-                "headers": self._filter_response_headers(dict(response.headers)),
-                "content_preview": response.text[:500] if response.text else "",
-                "response_content_full": response.text if response.text else "",
-                "timestamp": time.strftime("%H:%M:%S.") + f"{int((time.time() % 1) * 1000):03d}"
+                "size_bytes": len(body),
+                "headers": self._filter_response_headers(response.headers),
+                "response_body": body,
+                "timestamp": call_timestamp()
             }
             
-            # Add JSON data if available
+            # Add JSON data if available; skip bodies that aren't JSON (e.g. proxy HTML pages), but still
+            # parse JSON served under a generic type such as text/plain
             if response.status_code == 200:
-                try:
-                    response_data["json"] = response.json()
-                except Exception:
-                    response_data["json"] = None
+                content_type = response.headers.get("content-type", "")
+                response_data["json"] = None
+                if body and (not content_type or "json" in content_type or body[:64].lstrip()[:1] in (b"{", b"[")):
+                    try:
+                        response_data["json"] = _json_loads(body)
+                    except ValueError as e:  # Also covers orjson.JSONDecodeError
+                        if self.tui_debug_logger:
+                            self.tui_debug_logger.debug("Malformed JSON in registry response",
+                                                      url=url,
+                                                      content_type=content_type,
+                                                      error=str(e))
             
             return response_data
             
         except Exception as e:
-            duration = int((time.time() - start_time) * 1000)
-            
-            # Provide more detailed error information for debugging
-            error_details = f"Error: {str(e)}"
-            if "gcr.io" in url or "googleapis.com" in url:
-                error_details += " (Note: Google registries require authentication)"
-            elif "certificate" in str(e).lower() or "ssl" in str(e).lower():
-                error_details += " (TLS/SSL certificate issue)"
-            elif "permission" in str(e).lower() or "unauthorized" in str(e).lower():
-                error_details += " (Authentication required)"
+            duration = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             return {
                 "url": url,
@@ -379,18 +559,49 @@ class RegistryClient:
                 "duration_ms": duration,
                 "size_bytes": 0,
                 "headers": {},
-                "content_preview": error_details,
-                "response_content_full": error_details,
-                "timestamp": time.strftime("%H:%M:%S.") + f"{int((time.time() % 1) * 1000):03d}",
+                "response_content_full": self._describe_error(e, url),
+                "timestamp": call_timestamp(),
                 "error": str(e)
             }
     
-    async def check_api_version(self) -> Dict[str, Any]:
+    @staticmethod
+    def _describe_error(exc: Exception, url: str) -> str:
+        """Error text for a failed request, with a hint based on the exception type"""
+        error_details = f"Error: {exc}"
+        if "gcr.io" in url or "googleapis.com" in url:
+            return error_details + " (Note: Google registries require authentication)"
+        
+        # httpx wraps the underlying OS/ssl error, so look down the exception chain
+        cause = exc
+        while cause is not None:
+            if isinstance(cause, ssl.SSLError):
+                return error_details + " (TLS/SSL certificate issue)"
+            if isinstance(cause, PermissionError):
+                return error_details + " (Authentication required)"
+            cause = cause.__cause__ or cause.__context__
+        
+        if isinstance(exc, httpx.TimeoutException):
+            return error_details + " (Request timed out)"
+        return error_details
+    
+    async def check_api_version(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Check registry API version (GET /v2/)"""
-        return await self._make_request('/v2/')
+        return await self._make_request('/v2/', headers=headers, timeout=self.API_VERSION_TIMEOUT)
     
-    async def get_catalog(self, n: int = None, last: str = None, next_page: str = None) -> Dict[str, Any]:
-        """Get repository catalog (GET /v2/_catalog) with pagination support"""
+    async def get_catalog(self, n: int = None, last: str = None, next_page: str = None, next_link: str = None,
+                          headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Get repository catalog (GET /v2/_catalog) with pagination support
+        
+        next_link follows the Link rel="next" URL of a previous page as the registry
+        built it (its `last` or `next_page` cursor), with the page size replaced by n.
+        """
+        if next_link:
+            parsed = urlparse(next_link)
+            params = parse_qs(parsed.query, keep_blank_values=True)
+            if n:
+                params['n'] = [str(n)]
+            return await self._make_request(parsed._replace(query=urlencode(params, doseq=True)).geturl(), headers=headers)
+        
         endpoint = '/v2/_catalog'
         params = []
         if n:
@@ -401,93 +612,75 @@ class RegistryClient:
             params.append(f'next_page={next_page}')
         if params:
             endpoint += '?' + '&'.join(params)
-        return await self._make_request(endpoint)
+        return await self._make_request(endpoint, headers=headers)
     
-    async def get_tags(self, repository: str) -> Dict[str, Any]:
+    async def get_tags(self, repository: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Get tags for repository (GET /v2/{name}/tags/list)"""
-        return await self._make_request(f'/v2/{repository}/tags/list')
+        return await self._make_request(f'/v2/{repository}/tags/list', headers=headers)
     
     async def get_manifest(self, repository: str, tag: str) -> Dict[str, Any]:
         """Get manifest for specific tag (GET /v2/{name}/manifests/{tag})"""
-        url = urljoin(self.base_url + '/', f'/v2/{repository}/manifests/{tag}')
-        start_time = time.time()
-        
-        try:
-            # Accept multiple manifest formats + auth headers
-            headers = {
-                "Accept": ", ".join([
-                    "application/vnd.docker.distribution.manifest.v2+json",
-                    "application/vnd.docker.distribution.manifest.list.v2+json", 
-                    "application/vnd.oci.image.manifest.v1+json",
-                    "application/vnd.oci.image.index.v1+json",
-                    "application/vnd.docker.distribution.manifest.v1+json"
-                ])
-            }
-            # Add auth headers if configured
-            headers.update(self._get_auth_headers())
-            
-            response = await self.session.get(url, headers=headers)
-            duration = int((time.time() - start_time) * 1000)
-            
-            response_data = {
-                "url": url,
-                "method": response.request.method,
-                "status_code": response.status_code,
-                "duration_ms": duration,
-                "size_bytes": len(response.content),
-                "headers": self._filter_response_headers(dict(response.headers)),
-                "content_preview": response.text[:500] if response.text else "",
-                "timestamp": time.strftime("%H:%M:%S.") + f"{int((time.time() % 1) * 1000):03d}"
-            }
-            
-            if response.status_code == 200:
-                try:
-                    response_data["json"] = response.json()
-                except Exception:
-                    response_data["json"] = None
-            
-            return response_data
-            
-        except Exception as e:
-            duration = int((time.time() - start_time) * 1000)
-            
-            # Provide more detailed error information for debugging
-            error_details = f"Error: {str(e)}"
-            if "gcr.io" in url or "googleapis.com" in url:
-                error_details += " (Note: Google registries require authentication)"
-            elif "certificate" in str(e).lower() or "ssl" in str(e).lower():
-                error_details += " (TLS/SSL certificate issue)"
-            elif "permission" in str(e).lower() or "unauthorized" in str(e).lower():
-                error_details += " (Authentication required)"
-            
-            return {
-                "url": url,
-                "method": "GET",  # Known method for error case
-                "status_code": 0,
-                "duration_ms": duration,
-                "size_bytes": 0,
-                "headers": {},
-                "content_preview": error_details,
-                "response_content_full": error_details,
-                "timestamp": time.strftime("%H:%M:%S.") + f"{int((time.time() % 1) * 1000):03d}",
-                "error": str(e)
-            }
+        return await self._make_request(f'/v2/{repository}/manifests/{tag}', headers={"Accept": _MANIFEST_ACCEPT})
 
 
 class RegistryManager:
     """Manages multiple registry clients"""
     
+    # Tag list requests kept in flight at once when loading a catalog page
+    TAGS_FETCH_CONCURRENCY = 8
+    
+    # Successful /v2/, catalog and tag list responses are reused for a short window, so a status
+    # check and listing fired back to back (or overlapping refreshes) share one request
+    RESPONSE_CACHE_TTL = 5.0
+    
+    # Largest catalog page requested; the status probe asks for the same first page as a listing
+    CATALOG_PAGE_SIZE = 100
+    
+    # Response bodies longer than this are truncated in the debug log, bounding what
+    # the 100 logged calls can keep alive to a few MB
+    MAX_LOGGED_BODY_BYTES = 64 * 1024
+    
+    # After this many consecutive failures to reach a registry (connection errors, timeouts),
+    # its requests fail immediately for BREAKER_COOLDOWN seconds instead of each waiting out
+    # the timeout; the first request after the cool-down probes it again
+    BREAKER_THRESHOLD = 3
+    BREAKER_COOLDOWN = 30.0
+    
     def __init__(self):
-        self.api_call_log = []  # For debug console
+        self.api_call_log = deque(maxlen=100)  # For debug console; keeps only the last 100 calls
         self.tui_debug_logger = None  # For file-based debug logging
+        # Long-lived HTTP sessions by registry origin, so repeated status checks and listings
+        # reuse open connections instead of reconnecting (and re-negotiating TLS) every time
+        self._sessions: Dict[str, httpx.AsyncClient] = {}
+        # (registry, user, password hash, auth type, request) -> (monotonic time, response), plus the requests
+        # currently in flight so concurrent callers wait for them instead of duplicating them
+        self._response_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self._inflight_requests: Dict[Tuple, asyncio.Future] = {}
+        # Registry base URL -> (consecutive failures, monotonic time requests are allowed again)
+        self._breakers: Dict[str, Tuple[int, float]] = {}
+    
+    def get_session(self, registry_url: str) -> httpx.AsyncClient:
+        """Get (or create) the pooled HTTP session for a registry's origin"""
+        parsed = urlparse(registry_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        session = self._sessions.get(origin)
+        if session is None or session.is_closed:
+            session = self._sessions[origin] = RegistryClient.create_session()
+        return session
+    
+    async def aclose(self) -> None:
+        """Close all pooled HTTP sessions (call at shutdown)"""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.aclose()
     
     def set_tui_debug_logger(self, debug_logger):
         """Set the TUI debug logger for file-based auth/cache logging"""
-        self.tui_debug_logger = debug_logger
+        self.tui_debug_logger = _active_debug_logger(debug_logger)
     
     def _parse_link_header(self, link_header: str) -> Dict[str, str]:
         """Parse Link header to extract pagination URLs"""
-        import re
         links = {}
         
         if self.tui_debug_logger:
@@ -496,12 +689,11 @@ class RegistryManager:
         
         if link_header:
             # Parse: <url>; rel="next", <url2>; rel="prev"
-            pattern = r'<([^>]+)>;\s*rel="([^"]+)"'
-            matches = re.findall(pattern, link_header)
+            matches = _LINK_RE.findall(link_header)
             
             if self.tui_debug_logger:
                 self.tui_debug_logger.debug("Link header regex matches", 
-                                          pattern=pattern,
+                                          pattern=_LINK_RE.pattern,
                                           matches=matches,
                                           match_count=len(matches))
             
@@ -519,43 +711,155 @@ class RegistryManager:
         
         return links
     
-    def _extract_next_page_token(self, next_url: str) -> str:
-        """Extract next_page token from URL"""
-        import urllib.parse
+    async def _cached_request(self, client: "RegistryClient", request_key: Tuple,
+                              request: Callable[..., Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], bool]:
+        """Run a registry request, reusing a fresh cached or in-flight response for the same key
         
-        if self.tui_debug_logger:
-            self.tui_debug_logger.debug("Extracting next page token", 
-                                      next_url=next_url)
+        `request` is called with headers=... holding If-None-Match/If-Modified-Since when an
+        expired cached response has validators; a 304 reply reuses that cached response.
         
-        parsed = urllib.parse.urlparse(next_url)
-        params = urllib.parse.parse_qs(parsed.query)
+        Returns (response, fresh); fresh is False when the response was shared, in which case it
+        has already been logged and must not be added to the API log again, or when the registry
+        is being skipped after repeated connection failures.
+        """
+        # The password is part of the key (hashed, so it isn't kept in plain text) so corrected
+        # credentials never get a response cached or started with the old ones
+        password_hash = hashlib.sha256(client.password.encode()).hexdigest() if client.password else None
+        cache_key = (client.base_url, client.username, password_hash, client.auth_type) + request_key
         
-        if self.tui_debug_logger:
-            self.tui_debug_logger.debug("URL parsing results", 
-                                      parsed_query=parsed.query,
-                                      all_params=params,
-                                      has_next_page_param=('next_page' in params))
+        inflight = self._inflight_requests.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight), False
         
-        token = params.get('next_page', [''])[0]
+        cached = self._response_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.RESPONSE_CACHE_TTL:
+            return cached[1], False
         
-        if self.tui_debug_logger:
-            self.tui_debug_logger.debug("Next page token extracted", 
-                                      token=token[:50] + "..." if token and len(token) > 50 else token,
-                                      token_length=len(token) if token else 0)
+        breaker = self._breakers.get(client.base_url)
+        if breaker and time.monotonic() < breaker[1]:
+            return self._unreachable_response(client.base_url), False
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_requests[cache_key] = future
+        try:
+            response = await request(headers=self._conditional_headers(cached[1]) if cached else None)
+            fresh = True
+            self._record_reachability(client.base_url, response)
+            if response.get("status_code") == 304 and cached:
+                # Unchanged: log the 304 itself, but hand out the cached body and keep it fresh again
+                self.add_api_call(response)
+                response, fresh = cached[1], False
+            if response.get("status_code") == 200:
+                self._store_response(cache_key, response)
+            future.set_result(response)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved so an unwaited future doesn't log it again
+            raise
+        finally:
+            del self._inflight_requests[cache_key]
+            if not future.done():
+                future.cancel()  # Request cancelled; waiters see the cancellation too
+        
+        return response, fresh
+    
+    def _store_response(self, cache_key: Tuple, response: Dict[str, Any]) -> None:
+        """Cache a successful response for reuse and later revalidation"""
+        now = time.monotonic()
+        if len(self._response_cache) >= 256:
+            # Drop expired entries so the cache doesn't grow with every repository ever listed
+            self._response_cache = {key: entry for key, entry in self._response_cache.items()
+                                    if now - entry[0] < self.RESPONSE_CACHE_TTL}
+        self._response_cache[cache_key] = (now, response)
+    
+    @staticmethod
+    def _conditional_headers(response: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """If-None-Match/If-Modified-Since headers from a cached response's validators"""
+        response_headers = response.get("headers") or {}
+        headers = {}
+        if response_headers.get("etag"):
+            headers["If-None-Match"] = response_headers["etag"]
+        if response_headers.get("last-modified"):
+            headers["If-Modified-Since"] = response_headers["last-modified"]
+        return headers or None
+    
+    def _record_reachability(self, registry: str, response: Dict[str, Any]) -> None:
+        """Track consecutive transport failures for the circuit breaker
+        
+        Any HTTP response, even an error status, shows the registry is reachable.
+        """
+        if response.get("status_code") != 0:
+            self._breakers.pop(registry, None)
+            return
+        failures = self._breakers.get(registry, (0, 0.0))[0] + 1
+        open_until = time.monotonic() + self.BREAKER_COOLDOWN if failures >= self.BREAKER_THRESHOLD else 0.0
+        self._breakers[registry] = (failures, open_until)
+        if open_until and self.tui_debug_logger:
+            self.tui_debug_logger.debug("Registry unreachable - skipping requests during cool-down",
+                                      registry=registry,
+                                      consecutive_failures=failures,
+                                      cooldown_seconds=self.BREAKER_COOLDOWN)
+    
+    def _unreachable_response(self, registry: str) -> Dict[str, Any]:
+        """Error response returned without a request while a registry's breaker is open"""
+        error = f"Registry unreachable after {self.BREAKER_THRESHOLD} failed attempts; retrying in up to {self.BREAKER_COOLDOWN:.0f}s"
+        return {
+            "url": registry,
+            "method": "GET",
+            "status_code": 0,
+            "duration_ms": 0,
+            "size_bytes": 0,
+            "headers": {},
+            "response_content_full": f"Error: {error}",
+            "timestamp": call_timestamp(),
+            "error": error
+        }
+    
+    async def _logged_request(self, client: "RegistryClient", request_key: Tuple,
+                              request: Callable[..., Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run a (possibly cached) registry request and log it if it actually hit the network"""
+        response, fresh = await self._cached_request(client, request_key, request)
+        if fresh:
+            self.add_api_call(response)
+        return response
+    
+    async def _get_tags_concurrently(self, client: "RegistryClient", repositories: List[str],
+                                     return_exceptions: bool = False) -> List[Tuple[Dict[str, Any], bool]]:
+        """Fetch tags for each repository, at most TAGS_FETCH_CONCURRENCY at a time
         
-        return token
+        Returns (response, fresh) pairs as from _cached_request, in the order of `repositories`;
+        with return_exceptions, a request that raised leaves its exception in its place instead.
+        """
+        semaphore = asyncio.Semaphore(self.TAGS_FETCH_CONCURRENCY)
+        
+        async def get_tags(repo_name: str) -> Tuple[Dict[str, Any], bool]:
+            async with semaphore:
+                return await self._cached_request(client, ("tags", repo_name),
+                                                  lambda headers: client.get_tags(repo_name, headers=headers))
         
+        return await asyncio.gather(*(get_tags(repo_name) for repo_name in repositories),
+                                    return_exceptions=return_exceptions)
+    
     def add_api_call(self, call_data: Dict[str, Any]):
         """Add API call to debug log"""
-        self.api_call_log.append(call_data)
-        # Keep only last 100 calls
-        if len(self.api_call_log) > 100:
-            self.api_call_log = self.api_call_log[-100:]
+        # Cap previews at 500 chars; error responses reuse the full error text here
+        preview = call_data.get("content_preview")
+        if preview and len(preview) > 500:
+            call_data["content_preview"] = preview[:500]
+        for body_key in ("response_body", "response_content_full"):
+            body = call_data.get(body_key)
+            if body and len(body) > self.MAX_LOGGED_BODY_BYTES:
+                call_data[body_key] = body[:self.MAX_LOGGED_BODY_BYTES]
+                call_data["response_truncated"] = True
+        # Format the size once here instead of on every debug console load
+        call_data.setdefault("size_display", format_call_size(call_data.get("size_bytes", 0)))
+        self.api_call_log.append(call_data)  # Drops the oldest call once 100 are logged
     
     async def check_registry_status(self, registry_url: str, registry_config: Dict[str, str] = None) -> Dict[str, Any]:
         """Check if registry is accessible and get basic info"""
         # Use registry config if provided
-        client_kwargs = {'base_url': registry_url, 'tui_debug_logger': self.tui_debug_logger}
+        client_kwargs = {'base_url': registry_url, 'tui_debug_logger': self.tui_debug_logger,
+                         'session': self.get_session(registry_url)}
         if registry_config:
             client_kwargs.update({
                 'username': registry_config.get('username'),
@@ -564,13 +868,6 @@ class RegistryManager:
             })
         
         async with RegistryClient(**client_kwargs) as client:
-            version_response = await client.check_api_version()
-            self.add_api_call(version_response)
-            
-            # Always try catalog regardless of version response
-            catalog_response = await client.get_catalog()
-            self.add_api_call(catalog_response)
-            
             # Test monitored repositories if configured
             monitored_repo_accessible = False
             monitored_repos = registry_config.get('monitored_repos', []) if registry_config else []
@@ -580,12 +877,35 @@ class RegistryManager:
                                           monitored_repos_count=len(monitored_repos),
                                           registry_url=registry_url)
             
+            # Same first catalog page (size and cache key) as get_repositories with the configured
+            # limit, so a status check and the listing after it share one catalog request
+            first_page_size = min(self.CATALOG_PAGE_SIZE, (registry_config or {}).get('max_repos') or self.CATALOG_PAGE_SIZE)
+            
+            # Always try catalog regardless of version response. The probes are independent, so
+            # they run at once (the first monitored repo tests whether auth works) and are
+            # logged in request order afterwards
+            probes = [
+                self._cached_request(client, ("api_version",), client.check_api_version),
+                self._cached_request(client, ("catalog", first_page_size, None),
+                                     lambda headers: client.get_catalog(n=first_page_size, headers=headers)),
+            ]
             if monitored_repos:
-                # Test the first monitored repo to see if we have working auth
                 test_repo = monitored_repos[0]
+                probes.append(self._get_tags_concurrently(client, [test_repo], return_exceptions=True))
+            (version_response, version_fresh), (catalog_response, catalog_fresh), *test_results = await asyncio.gather(*probes)
+            if version_fresh:
+                self.add_api_call(version_response)
+            if catalog_fresh:
+                self.add_api_call(catalog_response)
+            
+            if monitored_repos:
                 try:
-                    test_response = await client.get_tags(test_repo)
-                    self.add_api_call(test_response)
+                    test_result = test_results[0][0]
+                    if isinstance(test_result, Exception):
+                        raise test_result
+                    test_response, test_fresh = test_result
+                    if test_fresh:
+                        self.add_api_call(test_response)
                     
                     if test_response["status_code"] == 200:
                         monitored_repo_accessible = True
@@ -612,7 +932,8 @@ class RegistryManager:
                 # If we also have monitored repos, show total count with monitored in parentheses
                 if monitored_repos and len(monitored_repos) > 0:
                     # Count monitored repos that are NOT in catalog (avoid double-counting)
-                    monitored_not_in_catalog = [repo for repo in monitored_repos if repo not in repos]
+                    catalog_repos = frozenset(repos)
+                    monitored_not_in_catalog = [repo for repo in monitored_repos if repo not in catalog_repos]
                     total_count = catalog_count + len(monitored_not_in_catalog)
                     repo_count = f"{total_count}({len(monitored_repos)})"
                 else:
@@ -665,7 +986,8 @@ class RegistryManager:
     async def get_repositories(self, registry_url: str, limit: int = 50, registry_config: Dict[str, str] = None, offset: int = 0) -> Dict[str, Any]:
         """Get repositories for a registry"""
         # Use registry config if provided
-        client_kwargs = {'base_url': registry_url, 'tui_debug_logger': self.tui_debug_logger}
+        client_kwargs = {'base_url': registry_url, 'tui_debug_logger': self.tui_debug_logger,
+                         'session': self.get_session(registry_url)}
         if registry_config:
             client_kwargs.update({
                 'username': registry_config.get('username'),
@@ -686,14 +1008,19 @@ class RegistryManager:
                                               monitored_count=len(monitored_repos),
                                               monitored_repos=monitored_repos)
                 
-                for repo_name in monitored_repos:
+                # Always load full tag info for monitored repos, several requests in flight at once
+                tags_results = await self._get_tags_concurrently(client, monitored_repos, return_exceptions=True)
+                
+                for repo_name, tags_result in zip(monitored_repos, tags_results):
                     try:
-                        # Always load full tag info for monitored repos
-                        tags_response = await client.get_tags(repo_name)
-                        self.add_api_call(tags_response)
+                        if isinstance(tags_result, Exception):
+                            raise tags_result
+                        tags_response, fresh = tags_result
+                        if fresh:
+                            self.add_api_call(tags_response)
                         
                         if tags_response["status_code"] == 200:
-                            response_json = tags_response.get("json", {})
+                            response_json = tags_response.get("json") or {}
                             all_tags = response_json.get("tags", [])
                             manifest_metadata = response_json.get("manifest", {})
                             tag_count = len(all_tags)
@@ -741,7 +1068,7 @@ class RegistryManager:
             # Now handle regular catalog pagination
             all_repositories = []
             next_page_token = None
-            page_size = min(100, limit + offset)  # Get enough to cover offset + limit
+            page_size = min(self.CATALOG_PAGE_SIZE, limit + offset)  # Get enough to cover offset + limit
             page_count = 0
             
             if self.tui_debug_logger:
@@ -761,8 +1088,9 @@ class RegistryManager:
                                               target_total=offset + limit,
                                               next_page_token=next_page_token[:50] + "..." if next_page_token and len(next_page_token) > 50 else next_page_token)
                 
-                catalog_response = await client.get_catalog(n=page_size, next_page=next_page_token)
-                self.add_api_call(catalog_response)
+                catalog_response = await self._logged_request(
+                    client, ("catalog", page_size, next_page_token),
+                    lambda headers: client.get_catalog(n=page_size, next_link=next_page_token, headers=headers))
                 
                 if catalog_response["status_code"] != 200:
                     if self.tui_debug_logger:
@@ -771,7 +1099,7 @@ class RegistryManager:
                                                   page_number=page_count)
                     break
                 
-                page_repos = catalog_response.get("json", {}).get("repositories", [])
+                page_repos = (catalog_response.get("json") or {}).get("repositories", [])
                 if not page_repos:
                     if self.tui_debug_logger:
                         self.tui_debug_logger.debug("No repositories in page - pagination complete", 
@@ -798,7 +1126,7 @@ class RegistryManager:
                     
                     links = self._parse_link_header(link_header)
                     if "next" in links:
-                        next_page_token = self._extract_next_page_token(links["next"])
+                        next_page_token = links["next"]  # Followed as-is; registries differ in cursor params
                         if self.tui_debug_logger:
                             self.tui_debug_logger.debug("Found next page token", 
                                                       next_page_token=next_page_token[:50] + "..." if next_page_token and len(next_page_token) > 50 else next_page_token)
@@ -837,19 +1165,28 @@ class RegistryManager:
                                           offset=offset,
                                           limit=limit,
                                           final_count=len(repositories))
-            repo_data = []
+            catalog_repo_data = []
             
             # Get basic repo info first, load tags for small lists or local registries
             load_tags = len(repositories) <= 50  # Only load tags if 50 or fewer repos
             
-            for repo_name in repositories[:limit]:
+            # Monitored repos were already loaded above; skip them here to avoid duplicates
+            monitored_repo_names = {repo['name'] for repo in monitored_repo_data}
+            repositories = [repo_name for repo_name in repositories if repo_name not in monitored_repo_names]
+            
+            # Load tags for small repository lists, several requests in flight at once
+            if load_tags:
+                tags_responses = await self._get_tags_concurrently(client, repositories)
+            else:
+                tags_responses = [(None, False)] * len(repositories)
+            
+            for repo_name, (tags_response, fresh) in zip(repositories, tags_responses):
                 if load_tags:
-                    # Load tags for small repository lists
-                    tags_response = await client.get_tags(repo_name)
-                    self.add_api_call(tags_response)
+                    if fresh:
+                        self.add_api_call(tags_response)
                     
                     if tags_response["status_code"] == 200:
-                        response_json = tags_response.get("json", {})
+                        response_json = tags_response.get("json") or {}
                         all_tags = response_json.get("tags", [])
                         manifest_metadata = response_json.get("manifest", {})
                         tag_count = len(all_tags)
@@ -868,7 +1205,7 @@ class RegistryManager:
                     recent_tags = []
                     recent_tags_display = "Too many repos - tags not loaded"
                 
-                repo_data.append({
+                catalog_repo_data.append({
                     "name": repo_name,
                     "tag_count": tag_count,
                     "recent_tags": recent_tags,
@@ -876,10 +1213,6 @@ class RegistryManager:
                     "last_updated": "Unknown"
                 })
             
-            # Filter out monitored repos from catalog to avoid duplicates
-            monitored_repo_names = {repo['name'] for repo in monitored_repo_data}
-            catalog_repo_data = [repo for repo in repo_data if repo['name'] not in monitored_repo_names]
-            
             # Add failed monitored repos as error entries (always show them)
             for failed_repo in failed_monitored_repos:
                 monitored_repo_data.append({
@@ -939,7 +1272,8 @@ class RegistryManager:
                                       method="LINK_HEADER_CONTINUATION")
         
         # Use registry config if provided
-        client_kwargs = {'base_url': registry_url, 'tui_debug_logger': self.tui_debug_logger}
+        client_kwargs = {'base_url': registry_url, 'tui_debug_logger': self.tui_debug_logger,
+                         'session': self.get_session(registry_url)}
         if registry_config:
             client_kwargs.update({
                 'username': registry_config.get('username'),
@@ -950,8 +1284,9 @@ class RegistryManager:
         
         async with RegistryClient(**client_kwargs) as client:
             # Make single page request with next_page token
-            catalog_response = await client.get_catalog(n=page_size, next_page=next_page_token)
-            self.add_api_call(catalog_response)
+            catalog_response = await self._logged_request(
+                client, ("catalog", page_size, next_page_token),
+                lambda headers: client.get_catalog(n=page_size, next_link=next_page_token, headers=headers))
             
             if catalog_response["status_code"] != 200:
                 error_msg = f"Status {catalog_response['status_code']}"
@@ -976,7 +1311,7 @@ class RegistryManager:
                     }
                 }
             
-            page_repos = catalog_response.get("json", {}).get("repositories", [])
+            page_repos = (catalog_response.get("json") or {}).get("repositories", [])
             if self.tui_debug_logger:
                 self.tui_debug_logger.debug("Pagination page fetched", 
                                           repos_in_page=len(page_repos))
@@ -995,7 +1330,7 @@ class RegistryManager:
                 
                 links = self._parse_link_header(link_header)
                 if "next" in links:
-                    new_next_page_token = self._extract_next_page_token(links["next"])
+                    new_next_page_token = links["next"]
                     if self.tui_debug_logger:
                         self.tui_debug_logger.debug("Found next continuation token", 
                                                   token_length=len(new_next_page_token) if new_next_page_token else 0)
@@ -1007,11 +1342,11 @@ class RegistryManager:
             for repo_name in page_repos:
                 if load_tags:
                     # Load tags for small repository lists
-                    tags_response = await client.get_tags(repo_name)
-                    self.add_api_call(tags_response)
+                    tags_response = await self._logged_request(client, ("tags", repo_name),
+                                                               lambda headers: client.get_tags(repo_name, headers=headers))
                     
                     if tags_response["status_code"] == 200:
-                        response_json = tags_response.get("json", {})
+                        response_json = tags_response.get("json") or {}
                         all_tags = response_json.get("tags", [])
                         manifest_metadata = response_json.get("manifest", {})
                         tag_count = len(all_tags)
@@ -473,7 +473,7 @@ class RegistryConfigModal(ModalScreen):
                     
                     if auth_type == "token":
                         # Use RegistryClient for token auth flow
-                        from registry_client import RegistryClient
+                        from registry_client import RegistryClient, call_response_text
                         async with RegistryClient(
                             base_url=registry_url,
                             username=username,
@@ -489,7 +489,7 @@ class RegistryConfigModal(ModalScreen):
                                     self.status = data["status_code"]
                                     self.headers = data.get("headers", {})
                                     self._json_data = data.get("json")
-                                    self._text_data = data.get("response_content_full", "")
+                                    self._text_data = call_response_text(data)
                                 
                                 async def json(self):
                                     return self._json_data
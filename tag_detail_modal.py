@@ -286,7 +286,7 @@ This will include:
         
         from registry_client import registry_manager, RegistryClient
         
-        async with RegistryClient(registry_url) as client:
+        async with RegistryClient(registry_url, session=registry_manager.get_session(registry_url)) as client:
             manifest_response = await client.get_manifest(repo_name, tag_name)
             registry_manager.add_api_call(manifest_response)
             
@@ -347,10 +347,9 @@ This will include:
         
         from local_container_client import LocalContainerClient
         
-        client = LocalContainerClient(runtime)
-        
         # Get manifest information using the local client
-        manifest_result = await client.get_manifest(repo_name, tag_name)
+        async with LocalContainerClient(runtime) as client:
+            manifest_result = await client.get_manifest(repo_name, tag_name)
         
         if 'error' not in manifest_result and manifest_result.get('status_code') == 200:
             manifest_data = manifest_result.get('data', {})
@@ -273,8 +273,8 @@ class TagsScreen(Screen):
         # Handle local container runtimes
         if registry_url.startswith("local://"):
             runtime = registry_url.split("://")[1]
-            client = LocalContainerClient(runtime)
-            tags_response = await client.get_tags(repo_name)
+            async with LocalContainerClient(runtime) as client:
+                tags_response = await client.get_tags(repo_name)
             
             if 'error' in tags_response:
                 self.notify(f"❌ Error loading {runtime} tags: {tags_response['error']}", severity="error")
@@ -308,13 +308,13 @@ class TagsScreen(Screen):
         
         from registry_client import registry_manager, RegistryClient
         
-        async with RegistryClient(registry_url) as client:
+        async with RegistryClient(registry_url, session=registry_manager.get_session(registry_url)) as client:
             # Get tags list
             tags_response = await client.get_tags(repo_name)
             registry_manager.add_api_call(tags_response)
             
             if tags_response["status_code"] == 200:
-                response_json = tags_response.get("json", {})
+                response_json = tags_response.get("json") or {}
                 all_available_tags = response_json.get("tags", [])
                 manifest_metadata = response_json.get("manifest", {})
                 
@@ -459,13 +459,13 @@ class TagsScreen(Screen):
         
         from registry_client import registry_manager, RegistryClient
         
-        async with RegistryClient(registry_url) as client:
+        async with RegistryClient(registry_url, session=registry_manager.get_session(registry_url)) as client:
             # Get tags list
             tags_response = await client.get_tags(repo_name)
             registry_manager.add_api_call(tags_response)
             
             if tags_response["status_code"] == 200:
-                response_json = tags_response.get("json", {})
+                response_json = tags_response.get("json") or {}
                 all_available_tags = response_json.get("tags", [])
                 manifest_metadata = response_json.get("manifest", {})
                 